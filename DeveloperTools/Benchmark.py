@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark.py
+
+Reproducible timings of the workbench hot paths: seal geometry for every
+catalog row, size table loading, natural sorting, translation lookups and
+SealsObject.execute in documents of 10 to 10,000 seals.
+
+Results are written as JSON and can be compared against a baseline run; the
+exit code is 1 when a benchmark got slower than the threshold allows.
+
+Usage:
+    Run with FreeCAD's python executable:
+    <PathToFreeCAD>/bin/python Benchmark.py [options]
+
+Options:
+    --output FILE         Write the results to FILE (JSON)
+    --baseline FILE       Compare against an earlier results file
+    --threshold PCT       Allowed slowdown of the fastest run in percent (default: 10)
+    --only PATTERN        Run benchmarks whose name matches PATTERN (fnmatch, repeatable)
+    --repeat N            Runs per benchmark (default: 5)
+    --seals 10,100,1000   Document sizes for the execute benchmarks (default: 10 to 10000)
+    --freecad-lib PATH    Directory containing FreeCAD.so/.pyd if not on sys.path
+    --list                Print the benchmark names and exit
+
+Without FreeCAD (e.g. a plain CI python with NumPy) a minimal stand-in for
+the FreeCAD module is installed and only the benchmarks that do not need the
+OCC kernel run: catalog loading, sorting and translations.
+"""
+
+import argparse
+import fnmatch
+import importlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+RESULTS_FORMAT = 1
+DEFAULT_SEALS = (10, 100, 1000, 10000)
+# Rows of the generated catalog used for the large table benchmarks
+SYNTHETIC_ROWS = 20000
+
+_benchmarks = []  # (name pattern, needs FreeCAD, factory)
+
+
+def benchmark(name, needs_freecad=False):
+    """
+    Register a factory yielding (name, run, items) cases. run() is timed
+    as a whole; items is the number of operations it performs.
+    """
+
+    def register(factory):
+        _benchmarks.append((name, needs_freecad, factory))
+        return factory
+
+    return register
+
+
+# --- FreeCAD -------------------------------------------------------------------
+def _install_freecad_stub(home):
+    """Minimal FreeCAD module for the benchmarks that do not use OCC."""
+
+    class _Params:
+        def __init__(self):
+            self.values = {}
+
+        def _get(self, key, default):
+            return self.values.get(key, default)
+
+        GetBool = GetInt = GetFloat = GetString = _get
+
+        def _set(self, key, value):
+            self.values[key] = value
+
+        SetBool = SetInt = SetFloat = SetString = _set
+
+        def Attach(self, observer):
+            pass
+
+    class _Console:
+        def PrintMessage(self, text):
+            sys.stdout.write(text)
+
+        PrintWarning = PrintError = PrintMessage
+
+        def PrintLog(self, text):
+            pass
+
+    groups = {}
+    stub = types.ModuleType("FreeCAD")
+    stub.Console = _Console()
+    stub.ParamGet = lambda path: groups.setdefault(path, _Params())
+    stub.getUserAppDataDir = lambda: home
+    stub.getUserCachePath = lambda: home
+    stub.getHomePath = lambda: home
+    stub.Version = lambda: ["stub"]
+    sys.modules["FreeCAD"] = stub
+    return stub
+
+
+def load_freecad(freecad_lib, home):
+    """Import FreeCAD, or install the stand-in. Returns True for the real one."""
+    if freecad_lib and freecad_lib not in sys.path:
+        sys.path.append(freecad_lib)
+    try:
+        importlib.import_module("FreeCAD")
+        importlib.import_module("Part")
+    except ImportError:
+        _install_freecad_stub(home)
+        return False
+    return True
+
+
+# --- Benchmarks ----------------------------------------------------------------
+@benchmark("geometry.*", needs_freecad=True)
+def bench_geometry(ctx):
+    """Solid of every catalog row, built directly (no shape cache)."""
+    import SealsMaker
+
+    maker = SealsMaker.Instance
+    builders = {
+        "oring": maker.makeORing,
+        "shaft_seal": maker.makeShaftSeal,
+        "vring": maker.makeVRing,
+        "usit": maker.makeUsitRing,
+    }
+    for type_id, build in builders.items():
+        definition = maker.get_definition(type_id)
+        count = len(definition["properties"])
+        data = definition["data"]
+        rows = [data[name][:count] for name in data.natural_order()]
+
+        def run(build=build, rows=rows):
+            for dims in rows:
+                build(*dims)
+
+        yield f"geometry.{type_id}", run, len(rows)
+
+
+@benchmark("catalog.*")
+def bench_catalog(ctx):
+    """Size table loading: CSV parsing and memory-mapped compiled tables."""
+    import SealsCatalog
+    import SealsUtils
+
+    files = [os.path.join(SealsUtils.dataPath, name) for name in ctx.catalog_files]
+    files.append(ctx.synthetic_catalog)
+    cache_dir = os.path.join(ctx.work_dir, "catalogs")
+    for path in files:
+        SealsCatalog.cached_table(path, cache_dir, SealsUtils.parse_csv_data)
+    rows = sum(len(SealsUtils.parse_csv_data(path)) for path in files)
+
+    def parse():
+        for path in files:
+            SealsUtils.parse_csv_data(path)
+
+    def compiled():
+        for path in files:
+            SealsCatalog.cached_table(path, cache_dir, SealsUtils.parse_csv_data)
+
+    def merge():
+        # The generated table as a vendor overlay of the O-ring table
+        SealsCatalog.merge_tables(
+            [
+                ("builtin", SealsCatalog.cached_table(files[0], cache_dir, SealsUtils.parse_csv_data)),
+                ("vendor", SealsCatalog.cached_table(files[-1], cache_dir, SealsUtils.parse_csv_data)),
+            ]
+        )
+
+    yield "catalog.parse_csv", parse, rows
+    yield "catalog.load_compiled", compiled, rows
+    yield "catalog.merge", merge, len(SealsUtils.parse_csv_data(files[0])) + SYNTHETIC_ROWS
+
+
+@benchmark("sort.*")
+def bench_sort(ctx):
+    """Natural sorting of size names."""
+    import SealsUtils
+
+    names = SealsUtils.parse_csv_data(ctx.synthetic_catalog).names
+    names = names[::-1]
+
+    def run():
+        sorted(names, key=SealsUtils.natural_sort_key)
+
+    yield "sort.natural_sort_key", run, len(names)
+
+
+@benchmark("locale.*")
+def bench_locale(ctx):
+    """Translation lookups of every catalog key."""
+    import SealsLocale
+
+    keys = list(SealsLocale.TRANSLATIONS["en"]) * 1000
+    tr = SealsLocale.tr
+
+    def run():
+        for key in keys:
+            tr(key)
+
+    yield "locale.tr", run, len(keys)
+
+
+@benchmark("document.*", needs_freecad=True)
+def bench_document(ctx):
+    """
+    SealsObject.execute over documents of n seals.
+    Seals cycle through all types and sizes; create_n builds every shape
+    after creation, recompute_n recomputes with unchanged geometry.
+    """
+    import FreeCAD
+    import SealsBase
+    import SealsMaker
+
+    maker = SealsMaker.Instance
+    maker.disk_cache = None  # Measure generation, not BREP reads
+    sizes = []
+    for type_id in ("oring", "shaft_seal", "vring", "usit"):
+        data = maker.get_definition(type_id)["data"]
+        sizes.extend((type_id, name) for name in data.natural_order())
+
+    def populate(doc, count):
+        for i in range(count):
+            type_id, size = sizes[i % len(sizes)]
+            obj = doc.addObject("Part::FeaturePython", "Seal")
+            SealsBase.SealsObject(obj, type_id)
+            obj.StandardSize = size
+            obj.Placement = FreeCAD.Placement(FreeCAD.Vector(20.0 * i, 0, 0), FreeCAD.Rotation())
+        return doc
+
+    for count in ctx.seals:
+
+        def create(count=count):
+            maker.clear_cache()
+            doc = populate(FreeCAD.newDocument("SealsBenchmark"), count)
+            try:
+                doc.recompute()
+            finally:
+                FreeCAD.closeDocument(doc.Name)
+
+        yield f"document.create_{count}", create, count
+
+        state = {}
+
+        def recompute(count=count):
+            doc = state.get("doc")
+            if doc is None:
+                doc = state["doc"] = populate(FreeCAD.newDocument("SealsBenchmark"), count)
+                doc.recompute()
+            for obj in doc.Objects:
+                obj.touch()
+            doc.recompute()
+
+        try:
+            yield f"document.recompute_{count}", recompute, count
+        finally:
+            # The runner is done with this case when the generator resumes
+            doc = state.pop("doc", None)
+            if doc is not None:
+                FreeCAD.closeDocument(doc.Name)
+
+
+# --- Runner --------------------------------------------------------------------
+class Context:
+    def __init__(self, work_dir, seals, repeat):
+        self.work_dir = work_dir
+        self.seals = seals
+        self.repeat = repeat
+        self.catalog_files = ["din_3771.csv", "din_3760.csv", "vring_type_a.csv", "usit_ring.csv"]
+        self.synthetic_catalog = write_synthetic_catalog(os.path.join(work_dir, "synthetic.csv"))
+
+
+def write_synthetic_catalog(path, rows=SYNTHETIC_ROWS):
+    """Deterministic O-ring style table, large enough to show scaling."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("name,d1,d2\n")
+        for i in range(rows):
+            d1 = 2.0 + (i * 7919 % 50000) / 100.0
+            d2 = (1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0)[i % 7]
+            f.write(f"V{i % 97}-{d1:g} x {d2:g},{d1:g},{d2:g}\n")
+    return path
+
+
+def selected(name, patterns):
+    return not patterns or any(fnmatch.fnmatch(name, p) for p in patterns)
+
+
+def run_benchmarks(ctx, patterns, have_freecad):
+    """Run the selected benchmarks and return {name: result}."""
+    results = {}
+    for group, needs_freecad, factory in _benchmarks:
+        if needs_freecad and not have_freecad:
+            print(f"  skipped {group} (needs FreeCAD)")
+            continue
+        for name, run, items in factory(ctx):
+            if not selected(name, patterns):
+                continue
+            # Documents with thousands of seals are timed once
+            runs = 1 if name.startswith("document.") and items > 1000 else ctx.repeat
+            times = []
+            run()  # Warm-up: imports, first-use tables, caches
+            for _ in range(runs):
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+            median = statistics.median(times)
+            results[name] = {
+                "median": median,
+                "min": min(times),
+                "runs": runs,
+                "items": items,
+                "per_item": median / items if items else None,
+            }
+            print(f"  {name:<28}{median * 1000.0:>12.2f} ms{median / max(items, 1) * 1e6:>12.2f} us/item")
+    return results
+
+
+def environment(have_freecad):
+    info = {"python": platform.python_version(), "platform": platform.platform()}
+    if have_freecad:
+        import FreeCAD
+
+        info["freecad"] = ".".join(str(v) for v in FreeCAD.Version()[:3])
+    else:
+        info["freecad"] = "stub"
+    return info
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the change of every benchmark against baseline and return the
+    names of those slower than threshold (a fraction, 0.1 = 10 %). The
+    fastest run is compared, as it is the least affected by other load.
+    """
+    regressions = []
+    print(f"\nComparison with baseline (threshold {threshold * 100:.0f} %):")
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"  {name:<28}{'new':>12}")
+            continue
+        change = result["min"] / old["min"] - 1.0 if old["min"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"  {name:<28}{change * 100:>+11.1f} %{flag}")
+    for name in baseline:
+        if name not in results:
+            print(f"  {name:<28}{'not run':>12}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SealsWorkbench hot paths.")
+    parser.add_argument("--output", default="", help="Results file (JSON)")
+    parser.add_argument("--baseline", default="", help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    parser.add_argument("--only", action="append", default=[], help="fnmatch pattern of benchmark names")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark")
+    parser.add_argument("--seals", default=",".join(str(n) for n in DEFAULT_SEALS), help="Document sizes")
+    parser.add_argument("--freecad-lib", default="", help="Directory containing the FreeCAD module")
+    parser.add_argument("--list", action="store_true", help="List the benchmark groups")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for group, needs_freecad, factory in _benchmarks:
+            print(f"{group:<14}{'(FreeCAD) ' if needs_freecad else ''}{factory.__doc__.strip().splitlines()[0]}")
+        return 0
+
+    work_dir = tempfile.mkdtemp(prefix="seals-bench-")
+    try:
+        have_freecad = load_freecad(args.freecad_lib, work_dir)
+        here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        if here not in sys.path:
+            sys.path.insert(0, here)
+
+        seals = [int(n) for n in args.seals.split(",") if n.strip()]
+        ctx = Context(work_dir, seals, max(1, args.repeat))
+        print(f"Running benchmarks ({'FreeCAD' if have_freecad else 'FreeCAD stub, OCC benchmarks skipped'})...")
+        results = run_benchmarks(ctx, args.only, have_freecad)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "format": RESULTS_FORMAT,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(have_freecad),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("format") != RESULTS_FORMAT:
+            print(f"Unsupported baseline format in {args.baseline}")
+            return 2
+        if baseline.get("environment", {}).get("freecad") != report["environment"]["freecad"]:
+            print("Note: baseline was recorded with a different FreeCAD version")
+        regressions = compare(results, baseline["results"], args.threshold / 100.0)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) slower than allowed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,8 @@
 """
 SketchToCode.py
 
-This tool extracts geometry from a FreeCAD sketch and generates
-Python code suitable for insertion into SealsMaker.py.
+This tool extracts geometry from a FreeCAD sketch and generates a profile
+declaration suitable for SealsData/profiles/<type>.json.
 
 Usage:
     Run with FreeCAD's python executable:
@@ -14,6 +14,7 @@ import FreeCAD
 import Part
 import sys
 import os
+import json
 
 def discretize_edge(edge, num_points=5):
     """Converts an edge (arc, etc.) into a list of points."""
@@ -114,44 +115,28 @@ def process_sketch(file_path, sketch_name=None):
     if p_end.y < min_z: min_z = p_end.y
     if p_end.y > max_z: max_z = p_end.y
 
-    # --- GENERATE CODE ---
-    print("\n    # --- GENERATED CODE START ---")
-    print(f"    # Source Sketch: {sketch.Name} (Bounds X: {min_x:.2f}-{max_x:.2f}, Y: {min_z:.2f}-{max_z:.2f})")
-    print("    # d1 = Inner Dia, d2 = Outer Dia, b = Height/Width")
-    print("    ")
-    print("    r_shaft = d1 / 2.0")
-    print("    r_bore = d2 / 2.0")
-    print("    ")
-    print(f"    # Scaling factors based on sketch bounds")
-    print(f"    sketch_x_min = {min_x:.4f}")
-    print(f"    sketch_x_max = {max_x:.4f}")
-    print(f"    sketch_z_min = {min_z:.4f}")
-    print(f"    sketch_z_max = {max_z:.4f}")
-    print("    ")
-    print("    # Map sketch X to radial thickness (r_shaft to r_bore)")
-    print("    x_scale_factor = (r_bore - r_shaft) / (sketch_x_max - sketch_x_min)")
-    print("    # Map sketch Y to axial width (0 to b)")
-    print("    z_scale_factor = b / (sketch_z_max - sketch_z_min)")
-    print("    ")
-    print("    def scale_point(x_sketch, z_sketch):")
-    print("        x_scaled = r_shaft + (x_sketch - sketch_x_min) * x_scale_factor")
-    print("        z_scaled = (z_sketch - sketch_z_min) * z_scale_factor")
-    print("        return FreeCAD.Vector(x_scaled, 0, z_scaled)")
-    print("    ")
-    print("    points = [")
-    
-    for p in raw_points:
-        print(f"        scale_point({p.x:.4f}, {p.y:.4f}),")
-    
-    # Add the final closing point explicitly to be safe, usually the start point
-    p0 = raw_points[0]
-    print(f"        scale_point({p0.x:.4f}, {p0.y:.4f})  # Closing loop")
-    print("    ]")
-    print("    ")
-    print("    wire = Part.makePolygon(points)")
-    print("    face = Part.Face(wire)")
-    print("    return face.revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360)")
-    print("    # --- GENERATED CODE END ---")
+    # --- GENERATE PROFILE ---
+    # Output is a profile declaration for SealsData/profiles/<type>.json.
+    # The sketch points are kept as they are; the x/z expressions map the
+    # sketch bounds onto [d1/2, d2/2] radially and [0, b] axially.
+    points = [[round(p.x, 4), round(p.y, 4)] for p in raw_points]
+    points.append(points[0])  # Closing loop
+    x_span = round(max_x - min_x, 4)
+    z_span = round(max_z - min_z, 4)
+    profile = {
+        "format": 1,
+        "parameters": ["d1", "d2", "b"],
+        "valid": ["d1 > 0", "d2 > 0", "b > 0", "d2 > d1"],
+        "derived": {"r_shaft": "d1 / 2", "r_bore": "d2 / 2"},
+        "outline": {
+            "kind": "polygon",
+            "points": points,
+            "x": f"r_shaft + (u - {min_x:.4f}) / {x_span} * (r_bore - r_shaft)",
+            "z": f"(v - {min_z:.4f}) / {z_span} * b",
+        },
+    }
+    print(f"// Source Sketch: {sketch.Name} (Bounds X: {min_x:.2f}-{max_x:.2f}, Y: {min_z:.2f}-{max_z:.2f})")
+    print(json.dumps(profile, indent=2))
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -35,30 +35,51 @@ class SealsWorkbench(FreeCADGui.Workbench):
     """Seals Workbench"""
     
     def Initialize(self):
-        # Late import of commands
-        import SealsCmd
-        SealsCmd.register_commands()
-        
-        self.cmdList = ["CreateORing", "CreateShaftSeal", "CreateVRing", "CreateUsitRing", "DuplicateSeal", "ChangeSealParameters"]
-        
-        # Use the global SealsLocale here, inside a method it usually works better, 
-        # but to be safe we will rely on the attributes set below.
-        toolbar_title = getattr(self, "MenuText", "Seals")
-        
-        # We can re-fetch translation here if needed
-        self.appendToolbar(toolbar_title, self.cmdList)
-        self.appendMenu(toolbar_title, self.cmdList)
-        
+        import SealsTiming
+        with SealsTiming.measure("workbench.initialize"):
+            # Late import of commands; SealsCmd defers the GUI, geometry and
+            # table modules until a command is run
+            import SealsCmd
+            SealsCmd.register_commands()
+
+            self.cmdList = ["CreateORing", "CreateShaftSeal", "CreateVRing", "CreateUsitRing", "DuplicateSeal", "LinkSeal", "LinkSealArray", "ChangeSealParameters"]
+
+            # Use the global SealsLocale here, inside a method it usually works better,
+            # but to be safe we will rely on the attributes set below.
+            toolbar_title = getattr(self, "MenuText", "Seals")
+
+            # We can re-fetch translation here if needed
+            self.appendToolbar(toolbar_title, self.cmdList)
+            self.appendMenu(toolbar_title, self.cmdList + ["Separator", "SetSealsDetailLevel", "ClearSealsCache", "SealsStartupTiming"])
+
         FreeCAD.Console.PrintMessage("SealsWorkbench: Initialized.\n")
 
     def Activated(self):
-        from SealsGui import SelectionObserver
         global selection_observer
-        selection_observer = SelectionObserver()
-        FreeCADGui.Selection.addObserver(selection_observer)
+        import SealsTiming
+        with SealsTiming.measure("workbench.activate"):
+            self.active = True
+            # Only the lightweight observer is registered here; the GUI,
+            # geometry and table modules load on the first seal command
+            if not globals().get("selection_observer"):
+                from SealsCmd import SelectionObserver
+                selection_observer = SelectionObserver()
+                FreeCADGui.Selection.addObserver(selection_observer)
+            import SealsUtils
+            if SealsUtils.get_params().GetBool("PrewarmTaskPanel", False):
+                from PySide import QtCore
+                QtCore.QTimer.singleShot(1000, self.deferred_prewarm)
+
+    def deferred_prewarm(self):
+        """Build the task panel in advance (opt-in, PrewarmTaskPanel preference)."""
+        if not getattr(self, "active", False):
+            return
+        import SealsGui
+        SealsGui.schedule_prewarm()
 
     def Deactivated(self):
         global selection_observer
+        self.active = False
         if 'selection_observer' in globals() and selection_observer:
             FreeCADGui.Selection.removeObserver(selection_observer)
             selection_observer = None
@@ -3,6 +3,59 @@ import FreeCAD
 import SealsUtils
 import SealsMaker
 import SealsLocale
+import SealsTiming
+
+# Values of the DetailLevel property. "Document" follows the document-wide
+# setting stored in the document's Meta map.
+DETAIL_LEVELS = ["Document"] + SealsMaker.DETAIL_LEVELS
+DETAIL_META_KEY = "SealsDetailLevel"
+
+# Number of shape rebuilds performed and skipped by SealsObject.execute
+rebuild_stats = {"performed": 0, "skipped": 0}
+
+# Only the first execute in a session is timed, later ones skip SealsTiming
+_first_execute_timed = False
+
+
+def reset_rebuild_stats():
+    rebuild_stats["performed"] = 0
+    rebuild_stats["skipped"] = 0
+
+
+def get_document_detail_level(doc):
+    """Return the document-wide seal detail level (default "Full")."""
+    level = doc.Meta.get(DETAIL_META_KEY, "Full") if doc else "Full"
+    return level if level in SealsMaker.DETAIL_LEVELS else "Full"
+
+
+def set_document_detail_level(doc, level):
+    """Store the document-wide detail level and rebuild the seals that follow it."""
+    if level not in SealsMaker.DETAIL_LEVELS:
+        raise ValueError(f"Unknown detail level: {level}")
+    meta = doc.Meta
+    meta[DETAIL_META_KEY] = level
+    doc.Meta = meta
+    for obj in doc.Objects:
+        if hasattr(obj, "SealType") and getattr(obj, "DetailLevel", "Document") == "Document":
+            obj.touch()
+    doc.recompute()
+
+
+def apply_standard_sizes(doc, changes, transaction="Change Seal Sizes"):
+    """
+    Switch several seals to other standard sizes. changes is an iterable of
+    (obj, size_key). All seals change in one undo entry and one recompute.
+    """
+    doc.openTransaction(transaction)
+    try:
+        for obj, size_key in changes:
+            proxy = obj.Proxy
+            dims = proxy.definition["data"].get(size_key)
+            if dims is not None:
+                proxy.apply_dimensions(obj, dims, size_key, recompute=False)
+    finally:
+        doc.commitTransaction()
+    doc.recompute()
 
 
 class SealsObject:
@@ -26,8 +79,7 @@ class SealsObject:
             SealsLocale.tr("obj.seal_type.desc"),
         ).SealType = type_id
 
-        data_keys = sorted(list(self.definition["data"].keys()), key=SealsUtils.natural_sort_key)
-        data_keys.insert(0, "Custom")
+        data_keys = ["Custom"] + self.definition["data"].natural_order()
         obj.addProperty(
             "App::PropertyEnumeration",
             "StandardSize",
@@ -47,43 +99,215 @@ class SealsObject:
             if i < len(defaults):
                 setattr(obj, prop["name"], defaults[i])
 
+        self.ensure_properties(obj)
         obj.Proxy = self
+        self.update_label(obj)
+
+    def ensure_properties(self, obj):
+        """Add properties introduced after the object was created."""
+        if not hasattr(obj, "DetailLevel"):
+            obj.addProperty(
+                "App::PropertyEnumeration",
+                "DetailLevel",
+                "Display",
+                SealsLocale.tr("obj.detail_level.desc"),
+            )
+            obj.DetailLevel = DETAIL_LEVELS
+            obj.DetailLevel = "Document"
+        if not hasattr(obj, "Density"):
+            obj.addProperty(
+                "App::PropertyDensity",
+                "Density",
+                "Mass Properties",
+                SealsLocale.tr("obj.density.desc"),
+            )
+            obj.Density = f"{self.definition.get('density', 1200)} kg/m^3"
+        for name, prop_type, desc_key in (
+            ("Volume", "App::PropertyVolume", "obj.volume.desc"),
+            ("SurfaceArea", "App::PropertyArea", "obj.area.desc"),
+            ("Mass", "App::PropertyMass", "obj.mass.desc"),
+        ):
+            if not hasattr(obj, name):
+                obj.addProperty(prop_type, name, "Mass Properties", SealsLocale.tr(desc_key))
+                obj.setEditorMode(name, 1)  # Read-only
+        if not hasattr(obj, "ShapeFingerprint"):
+            # Identity of the geometry in obj.Shape, lets execute skip rebuilds
+            obj.addProperty(
+                "App::PropertyString",
+                "ShapeFingerprint",
+                "Base",
+                SealsLocale.tr("obj.fingerprint.desc"),
+            )
+            obj.setEditorMode("ShapeFingerprint", 2)  # Hidden
+
+    def onDocumentRestored(self, obj):
+        maker = SealsMaker.Instance
+        self.definition = maker.get_definition(maker.normalize_type_id(obj.SealType))
+        self.ensure_properties(obj)
+        # Follow a language change since the document was saved
+        self.update_label(obj)
+
+    def shape_fingerprint(self, obj):
+        """Hashable identity of the generated geometry (type, dimensions, detail)."""
+        maker = SealsMaker.Instance
+        dims = self.dimension_values(obj)
+        return maker.cache_key(
+            maker.normalize_type_id(obj.SealType), dims, self.effective_detail_level(obj), maker.optimize_topology
+        )
+
+    def effective_detail_level(self, obj):
+        level = getattr(obj, "DetailLevel", "Full")
+        if level == "Document":
+            return get_document_detail_level(obj.Document)
+        return level
 
     def execute(self, obj):
+        global _first_execute_timed
+        if _first_execute_timed:
+            self.rebuild(obj)
+            return
+        _first_execute_timed = True
+        with SealsTiming.measure("seal.first"):
+            self.rebuild(obj)
+
+    def rebuild(self, obj):
+        """Regenerate obj.Shape unless its fingerprint is unchanged."""
         try:
-            dims = []
-            for prop in self.definition["properties"]:
-                val = getattr(obj, prop["name"])
-                if hasattr(val, "Value"):
-                    dims.append(val.Value)
-                else:
-                    dims.append(val)
-
-            type_label = SealsLocale.tr(self.definition["label_key"])
-            is_custom = obj.StandardSize == "Custom"
-            if not is_custom:
-                obj.Label = f"{type_label} {obj.StandardSize}"
+            dims = self.dimension_values(obj)
+            # Also on the skip path, e.g. after a language change. Label is
+            # not a recompute input, so this does not touch the graph.
+            label = self.build_label(obj, dims)
+            if obj.Label != label:
+                obj.Label = label
+            maker = SealsMaker.Instance
+            type_id = maker.normalize_type_id(obj.SealType)
+            detail = self.effective_detail_level(obj)
+            key = maker.cache_key(type_id, dims, detail, maker.optimize_topology)
+            # The profile signature makes edited profile declarations rebuild
+            fingerprint = f"{maker.profile_signature(type_id)[:12]}:{key[1:]}"
+            if obj.ShapeFingerprint == fingerprint and not obj.Shape.isNull():
+                rebuild_stats["skipped"] += 1
             else:
-                dim_str = "x".join(
-                    [str(round(d, 2)).rstrip("0").rstrip(".") for d in dims]
-                )
-                obj.Label = f"{type_label} {dim_str}"
+                obj.Shape = maker.make_shape(type_id, dims, detail, key[3])
+                obj.ShapeFingerprint = fingerprint
+                rebuild_stats["performed"] += 1
+                self._mass_key = None
 
-            generator = self.definition["generator"]
-            obj.Shape = generator(*dims)
+            mass_key = (fingerprint, obj.Density.Value)
+            if getattr(self, "_mass_key", None) != mass_key:
+                self.update_mass_properties(obj, type_id, dims)
+                self._mass_key = mass_key
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error computing seal: {e}\n")
 
+    def dimension_values(self, obj):
+        """Dimensions of obj as plain numbers in mm."""
+        return [getattr(getattr(obj, p["name"]), "Value", getattr(obj, p["name"]))
+                for p in self.definition["properties"]]
+
+    def update_label(self, obj):
+        """
+        Name the seal after its size and the active language; links follow
+        through onChanged. Called on size edits, on restore and by rebuild().
+        """
+        label = self.build_label(obj, self.dimension_values(obj))
+        if obj.Label != label:
+            obj.Label = label
+
+    def build_label(self, obj, dims):
+        type_label = SealsLocale.tr(self.definition["label_key"])
+        if obj.StandardSize != "Custom":
+            return f"{type_label} {obj.StandardSize}"
+        dim_str = "x".join([str(round(d, 2)).rstrip("0").rstrip(".") for d in dims])
+        return f"{type_label} {dim_str}"
+
+    def update_mass_properties(self, obj, type_id, dims):
+        """Fill the read-only mass properties from the analytic profile."""
+        if not hasattr(obj, "Mass"):
+            return
+        # Density.Value is in kg/mm^3, mass_properties expects kg/m^3
+        props = SealsMaker.Instance.mass_properties(type_id, dims, obj.Density.Value * 1e9)
+        if props["volume"] != props["volume"]:  # NaN, invalid dimensions
+            props = {"volume": 0.0, "area": 0.0, "mass": 0.0}
+        obj.Volume = props["volume"]
+        obj.SurfaceArea = props["area"]
+        obj.Mass = props["mass"]
+
+    def update_link_labels(self, obj, old_label):
+        """
+        Keep the labels of links to this seal in sync with its size. Links to
+        links are followed, and the elements of a link array through their
+        array.
+        """
+        seen = set()
+        pending = list(obj.InList)
+        while pending:
+            parent = pending.pop()
+            if parent.TypeId != "App::Link" or parent.Name in seen:
+                continue
+            seen.add(parent.Name)
+            for link in [parent] + list(getattr(parent, "ElementList", [])):
+                if link.Label.startswith(old_label):
+                    link.Label = obj.Label + link.Label[len(old_label):]
+            pending.extend(parent.InList)
+
+    def onBeforeChange(self, obj, prop):
+        if prop == "Label":
+            self._old_label = obj.Label
+
     def onChanged(self, obj, prop):
-        if prop == "StandardSize":
+        if not getattr(self, "definition", None) or "Restore" in obj.State:
+            return
+        if prop == "StandardSize" and not getattr(self, "_applying", False):
             self.update_dimensions_from_standard(obj)
+            self.update_label(obj)
+        elif prop in self.dimension_names() and not getattr(self, "_applying", False):
+            self.update_label(obj)
+        elif prop == "Label":
+            old_label = getattr(self, "_old_label", None)
+            self._old_label = None
+            if old_label and old_label != obj.Label:
+                self.update_link_labels(obj, old_label)
+
+    def dimension_names(self):
+        return [p["name"] for p in self.definition["properties"]]
 
     def update_dimensions_from_standard(self, obj):
         if obj.StandardSize != "Custom" and obj.StandardSize in self.definition["data"]:
-            dims = self.definition["data"][obj.StandardSize]
-            for i, prop in enumerate(self.definition["properties"]):
-                if i < len(dims):
-                    setattr(obj, prop["name"], dims[i])
+            self.apply_dimensions(obj, self.definition["data"][obj.StandardSize], recompute=False)
+
+    def apply_dimensions(self, obj, dims, size_key=None, transaction=None, recompute=True):
+        """
+        Set the standard size and all dimensions of obj in one step.
+        dims are plain numbers in mm; only values that differ are assigned.
+        With a transaction name the change is a single undo entry, and the
+        document is recomputed once at the end.
+        """
+        doc = obj.Document
+        if transaction:
+            doc.openTransaction(transaction)
+        self._applying = True
+        try:
+            if size_key is not None and obj.StandardSize != size_key:
+                obj.StandardSize = size_key
+            for prop, value in zip(self.definition["properties"], dims):
+                current = getattr(obj, prop["name"])
+                if float(getattr(current, "Value", current)) != float(value):
+                    setattr(obj, prop["name"], float(value))
+        finally:
+            self._applying = False
+            self.update_label(obj)
+            if transaction:
+                doc.commitTransaction()
+        if recompute:
+            doc.recompute()
+
+    def __getstate__(self):
+        # The definition is looked up again in onDocumentRestored
+        return None
+
+    def __setstate__(self, state):
+        return None
 
 
 class ViewProvider:
@@ -93,22 +317,122 @@ class ViewProvider:
 
     def getIcon(self):
         if hasattr(self.vobj.Object, "SealType"):
-            stype = self.vobj.Object.SealType
-            type_id = SealsMaker.Instance.normalize_type_id(stype) or stype
-            if "oring" in type_id:
-                return SealsUtils.get_icon("icon_oring.svg")
-            if "shaft" in type_id:
-                return SealsUtils.get_icon("icon_shaft_seal.svg")
-            if "vring" in type_id:
-                return SealsUtils.get_icon("icon_vring.svg")
-            if "usit" in type_id:
-                return SealsUtils.get_icon("icon_usit_ring.svg")
+            maker = SealsMaker.Instance
+            definition = maker.get_definition(maker.normalize_type_id(self.vobj.Object.SealType))
+            if definition:
+                return SealsUtils.get_icon(definition["icon"])
         return SealsUtils.get_icon("icon_workbench.svg")
 
     def attach(self, vobj):
+        self.vobj = vobj
+        self.lod_display_mode = None
+        self.mesh_key = None
         vobj.addDisplayMode(vobj.Object, "Standard")
+        if SealsUtils.get_params().GetBool("SharedTessellation", False):
+            self.attach_shared_mode(vobj)
+
+    def attach_shared_mode(self, vobj):
+        """
+        Add the "Shared" display mode: per-object materials above mesh nodes
+        shared through SealsMesh by all seals with the same geometry. The
+        mode has no selection or preselection, so it is opt-in through the
+        SharedTessellation preference.
+        """
+        from pivy import coin
+
+        self.shared_root = coin.SoSeparator()
+        self.face_material = coin.SoMaterial()
+        self.line_material = coin.SoMaterial()
+        self.line_style = coin.SoDrawStyle()
+        self.faces_slot = coin.SoGroup()
+        self.edges_slot = coin.SoGroup()
+        self.shared_root.addChild(self.face_material)
+        self.shared_root.addChild(self.faces_slot)
+        self.shared_root.addChild(self.line_material)
+        self.shared_root.addChild(self.line_style)
+        self.shared_root.addChild(self.edges_slot)
+        vobj.addDisplayMode(self.shared_root, "Shared")
+        self.update_shared_materials(vobj)
+
+    def getDisplayModes(self, vobj):
+        return ["Shared"] if getattr(self, "shared_root", None) else []
+
+    def updateData(self, obj, prop):
+        if prop == "Shape":
+            self.update_detail_display_mode(obj)
+            self.update_shared_mesh(obj)
+
+    def onChanged(self, vobj, prop):
+        if prop == "Deviation":
+            self.update_shared_mesh(vobj.Object)
+        elif prop in ("ShapeColor", "LineColor", "LineWidth", "Transparency"):
+            self.update_shared_materials(vobj)
+
+    def onDelete(self, vobj, subelements):
+        self.release_shared_mesh()
+        return True
+
+    def update_shared_mesh(self, obj):
+        """Point the Shared display mode at the cached mesh of obj's geometry."""
+        if not getattr(self, "shared_root", None):
+            return
+        proxy = getattr(obj, "Proxy", None)
+        if not hasattr(proxy, "shape_fingerprint") or obj.Shape.isNull():
+            self.release_shared_mesh()
+            return
+        import SealsMesh
+
+        deviation = getattr(obj.ViewObject, "Deviation", 0.5)
+        fingerprint = proxy.shape_fingerprint(obj)
+        if self.mesh_key == (fingerprint, round(float(deviation), 4)):
+            return
+        key, faces, edges = SealsMesh.acquire(fingerprint, obj.Shape, deviation, obj.Document.Name)
+        self.release_shared_mesh()
+        self.mesh_key = key
+        self.mesh_document = obj.Document.Name
+        self.faces_slot.addChild(faces)
+        self.edges_slot.addChild(edges)
+
+    def release_shared_mesh(self):
+        if not getattr(self, "mesh_key", None):
+            return
+        import SealsMesh
+
+        self.faces_slot.removeAllChildren()
+        self.edges_slot.removeAllChildren()
+        SealsMesh.release(self.mesh_key, self.mesh_document)
+        self.mesh_key = None
+
+    def update_shared_materials(self, vobj):
+        if not getattr(self, "shared_root", None):
+            return
+        if hasattr(vobj, "ShapeColor"):
+            self.face_material.diffuseColor = tuple(vobj.ShapeColor[:3])
+        if hasattr(vobj, "Transparency"):
+            self.face_material.transparency = vobj.Transparency / 100.0
+        if hasattr(vobj, "LineColor"):
+            self.line_material.diffuseColor = tuple(vobj.LineColor[:3])
+        if hasattr(vobj, "LineWidth"):
+            self.line_style.lineWidth = vobj.LineWidth
+
+    def update_detail_display_mode(self, obj):
+        """Show proxy seals as wireframe, restoring the previous mode afterwards."""
+        proxy = getattr(obj, "Proxy", None)
+        if not hasattr(proxy, "effective_detail_level"):
+            return
+        vobj = obj.ViewObject
+        if proxy.effective_detail_level(obj) == "Proxy":
+            # The Shared mode draws the proxy edges itself
+            if vobj.DisplayMode not in ("Wireframe", "Shared"):
+                self.lod_display_mode = vobj.DisplayMode
+                vobj.DisplayMode = "Wireframe"
+        elif getattr(self, "lod_display_mode", None):
+            vobj.DisplayMode = self.lod_display_mode
+            self.lod_display_mode = None
 
     def getDefaultDisplayMode(self):
+        if SealsUtils.get_params().GetBool("SharedTessellation", False):
+            return "Shared"
         return "Standard"
 
     def __getstate__(self):
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Caches for generated seal geometry.
+Identical seals (same type and dimensions) are built once and handed out as
+cheap copies afterwards. ShapeCache keeps them in memory for the session,
+DiskShapeCache keeps serialized BREP files across sessions.
+"""
+import os
+import time
+import hashlib
+from collections import OrderedDict
+import FreeCAD
+import Part
+import SealsUtils
+
+
+def copy_shape(shape):
+    """Return a copy of shape that shares the underlying geometry."""
+    try:
+        return shape.copy(False)
+    except TypeError:
+        # Older FreeCAD versions do not accept the copyGeom flag
+        return shape.copy()
+
+
+class ShapeCache:
+    """
+    Bounded LRU cache of generated shapes.
+    Keys are built by SealsMakerClass.cache_key, values are the shapes as
+    returned by the generators. Callers always receive copies.
+    """
+
+    def __init__(self, max_entries=256):
+        self._entries = OrderedDict()
+        self.max_entries = max(0, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Return a copy of the cached shape for key, or None."""
+        shape = self._entries.get(key)
+        if shape is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy_shape(shape)
+
+    def put(self, key, shape):
+        """Store shape under key, evicting the least recently used entries."""
+        if self.max_entries <= 0 or shape is None or shape.isNull():
+            return
+        self._entries[key] = shape
+        self._entries.move_to_end(key)
+        self._prune()
+
+    def resize(self, max_entries):
+        self.max_entries = max(0, int(max_entries))
+        self._prune()
+
+    def clear(self):
+        self._entries.clear()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _prune(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+def default_cache_dir(*parts):
+    """Return the workbench directory inside FreeCAD's user cache location."""
+    return SealsUtils.user_cache_dir(*parts)
+
+
+class DiskShapeCache:
+    """
+    Directory of BREP files named by a digest of the seal type, its profile
+    definition and its quantized dimensions. Reading an entry refreshes its
+    modification time, and the oldest entries are pruned once the directory
+    grows beyond max_bytes.
+    """
+
+    SUFFIX = ".brep"
+    TEMP_SUFFIX = ".tmp"
+    # Temporary files older than this (seconds) are left over from writers
+    # that were killed, younger ones may still be written by another process
+    TEMP_MAX_AGE = 3600
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._size = None  # Total bytes on disk, scanned on first write
+
+    @staticmethod
+    def digest(*parts):
+        """Build an entry name from arbitrary key parts."""
+        return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, digest):
+        return os.path.join(self.directory, digest + self.SUFFIX)
+
+    def get(self, digest):
+        """Return the stored shape for digest, or None."""
+        path = self._path(digest)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        try:
+            shape = Part.Shape()
+            shape.importBrep(path)
+            os.utime(path)
+        except Exception:
+            # Unreadable or concurrently pruned entry
+            self.misses += 1
+            return None
+        if shape.isNull():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return shape
+
+    def put(self, digest, shape):
+        """Write shape to the cache. Failures are reported but not raised."""
+        if self.max_bytes <= 0 or shape is None or shape.isNull():
+            return
+        path = self._path(digest)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            shape.exportBrep(tmp_path)
+            try:
+                # An existing entry (repeated or concurrent write) is replaced
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except Exception as e:
+            FreeCAD.Console.PrintWarning(f"Could not write seal shape cache {path}: {e}\n")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self.writes += 1
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += os.path.getsize(path) - replaced
+        if self._size > self.max_bytes:
+            self.prune()
+
+    def _entries(self):
+        """
+        Return (mtime, size, path) for every cache file, including temporary
+        files older than TEMP_MAX_AGE.
+        """
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        stale = time.time() - self.TEMP_MAX_AGE
+        for name in names:
+            temp = name.endswith(self.TEMP_SUFFIX)
+            if not temp and not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if temp:
+                if st.st_mtime > stale:
+                    continue
+                # Sorted before every entry, prune removes them first
+                entries.append((0.0, st.st_size, path))
+            else:
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def prune(self, max_bytes=None):
+        """
+        Delete stale temporary files, then least recently used entries until
+        the cache fits max_bytes.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        # Prune a little below the cap so we do not prune again on every write
+        target = int(limit * 0.9)
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            # Stale temporary files (mtime 0) are removed even below the cap
+            if total <= target and mtime:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        self._size = total
+
+    def clear(self):
+        """Remove every cached file."""
+        self.prune(0)
+
+    def stats(self):
+        if self._size is None:
+            self._size = self._scan_size()
+        return {
+            "directory": self.directory,
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
@@ -0,0 +1,502 @@
+# -*- coding: utf-8 -*-
+"""
+Indexed seal size tables.
+
+SizeTable holds the rows of one norm table (size name -> tuple of values)
+and behaves like the plain dict it replaces. On top of that it keeps:
+    - one sorted index per numeric column, for range queries in O(log n + m)
+    - k-d trees over the numeric columns, for nearest size queries in
+      O(log n) on average, built on the first query
+Column names are those of the CSV header (d1, d2, b, s, h, ...).
+
+Parsed tables can be compiled to NumPy files (see cached_table) that later
+sessions memory-map instead of parsing the CSV again.
+
+This module does not depend on FreeCAD.
+"""
+import os
+import re
+import json
+import heapq
+import hashlib
+from collections.abc import Mapping
+
+import numpy as np
+
+
+def natural_sort_key(value):
+    """Return a key suitable for natural sorting of strings like '10x2'."""
+    parts = re.split(r"(\d+)", str(value))
+    processed = []
+    for p in parts:
+        if p.isdigit():
+            processed.append(int(p))
+        else:
+            processed.append(p.lower())
+    return processed
+
+
+def normalize_search(text):
+    """Canonical form of size names and search input: '20 X 3,0' -> '20x3.0'."""
+    text = str(text).lower().replace(",", ".")
+    for times in ("×", "*"):
+        text = text.replace(times, "x")
+    return "".join(text.split())
+
+
+class KDTree:
+    """
+    Static k-d tree over the rows of an (n, k) array. The tree is implicit:
+    an index range [lo, hi) is split at mid = (lo + hi) // 2 into [lo, mid)
+    and [mid, hi); ranges of at most LEAF_SIZE rows are scanned directly.
+    """
+
+    LEAF_SIZE = 16
+
+    def __init__(self, points):
+        self.points = np.asarray(points, dtype=float)
+        count = len(self.points)
+        self.index = np.arange(count)
+        self.axis = np.zeros(count, dtype=int)
+        self.split = np.zeros(count)
+        stack = [(0, count)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= self.LEAF_SIZE:
+                continue
+            points = self.points[self.index[lo:hi]]
+            # Split along the widest dimension at the median
+            axis = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+            mid = (lo + hi) // 2
+            order = np.argpartition(points[:, axis], mid - lo)
+            self.index[lo:hi] = self.index[lo:hi][order]
+            self.axis[mid] = axis
+            self.split[mid] = points[order[mid - lo], axis]
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+        # Plain Python values are much faster to compare one at a time
+        self._rows = self.points.tolist()
+        self._index = self.index.tolist()
+        self._axis = self.axis.tolist()
+        self._split = self.split.tolist()
+
+    def __len__(self):
+        return len(self.points)
+
+    def query(self, point, k=1):
+        """Return [(distance, row), ...] of the k rows closest to point."""
+        point = [float(v) for v in point]
+        best = []  # max-heap of (-squared distance, -row)
+        index, axes, splits, rows = self._index, self._axis, self._split, self._rows
+        leaf_size = self.LEAF_SIZE
+
+        def visit(lo, hi):
+            if hi - lo <= leaf_size:
+                for row in index[lo:hi]:
+                    dist = sum((a - b) ** 2 for a, b in zip(rows[row], point))
+                    if len(best) < k:
+                        heapq.heappush(best, (-dist, -row))
+                    elif (-dist, -row) > best[0]:
+                        heapq.heapreplace(best, (-dist, -row))
+                return
+            mid = (lo + hi) // 2
+            diff = point[axes[mid]] - splits[mid]
+            if diff < 0:
+                visit(lo, mid)
+                if len(best) < k or diff * diff <= -best[0][0]:
+                    visit(mid, hi)
+            else:
+                visit(mid, hi)
+                if len(best) < k or diff * diff <= -best[0][0]:
+                    visit(lo, mid)
+
+        if len(self.points) and k > 0:
+            visit(0, len(self.points))
+        return [(float(np.sqrt(-d)), -r) for d, r in sorted(best, reverse=True)]
+
+
+class SizeTable(Mapping):
+    """Read-only mapping of size name -> values with dimension indexes."""
+
+    def __init__(self, rows, columns=()):
+        rows = dict(rows)
+        columns = list(columns)
+        width = max([len(columns)] + [len(values) for values in rows.values()])
+        array = np.full((len(rows), width), np.nan)
+        text = {}
+        for i, values in enumerate(rows.values()):
+            for j, value in enumerate(values):
+                if isinstance(value, (int, float)):
+                    array[i, j] = value
+                else:
+                    if j not in text:
+                        text[j] = [np.nan] * len(rows)
+                    text[j][i] = value
+        widths = [len(values) for values in rows.values()]
+        self._setup(list(rows), columns, array, text, widths)
+
+    @classmethod
+    def from_arrays(cls, names, columns, array, text=None, widths=None, orders=None, natural=None):
+        """
+        Build a table from a (rows, columns) float array without touching its
+        contents, e.g. a memory-mapped compiled catalog. text maps the index
+        of each column with non-numeric cells to its cell values, used where
+        array holds NaN. widths is the number of values per row (default:
+        all); orders and natural are the index arrays of save_compiled().
+        """
+        table = cls.__new__(cls)
+        table._setup(names, columns, array, text or {}, widths, orders, natural)
+        return table
+
+    def _setup(self, names, columns, array, text, widths=None, orders=None, natural=None):
+        self.names = list(names)
+        self.columns = list(columns)
+        self.array = array
+        self._text = text
+        self._widths = widths
+        self._row_index = None
+        if orders is None:
+            # Sorted index per column; rows without a number sort last and are skipped
+            orders = []
+            for j in range(len(self.columns)):
+                valid = np.flatnonzero(~np.isnan(array[:, j]))
+                orders.append(valid[np.argsort(array[valid, j], kind="stable")])
+        self._orders = dict(zip(self.columns, orders))
+        self._sorted = {}
+        self._trees = {}
+        self._natural_positions = natural
+        self._natural_order = None
+        self._search_keys = None
+        # Source tags, see merge_tables
+        self.sources = []
+        self._source_of = None
+
+    # --- Mapping ---
+    def _position(self, key):
+        if self._row_index is None:
+            self._row_index = {name: i for i, name in enumerate(self.names)}
+        return self._row_index[key]
+
+    def __getitem__(self, key):
+        i = self._position(key)
+        values = self.array[i].tolist()
+        for j, cells in self._text.items():
+            if values[j] != values[j]:  # NaN: text cell
+                values[j] = cells[i]
+        if self._widths is not None:
+            del values[self._widths[i]:]
+        return tuple(values)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, key):
+        try:
+            self._position(key)
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self):
+        return f"SizeTable({len(self)} rows, columns={self.columns})"
+
+    # --- Columns ---
+    def numeric_columns(self):
+        return [c for c in self.columns if len(self._orders[c])]
+
+    def column(self, name):
+        return self.array[:, self._column_index(name)]
+
+    def _column_index(self, name):
+        try:
+            return self.columns.index(name)
+        except ValueError:
+            raise KeyError(f"Unknown column: {name}") from None
+
+    def _column_sort(self, column):
+        """(row order, sorted values) of a column, read on first use."""
+        entry = self._sorted.get(column)
+        if entry is None:
+            order = np.asarray(self._orders[column])
+            entry = self._sorted[column] = (order, self.array[order, self._column_index(column)])
+        return entry
+
+    def _tree(self, columns):
+        tree = self._trees.get(columns)
+        if tree is None:
+            cols = [self._column_index(c) for c in columns]
+            points = self.array[:, cols]
+            rows = np.flatnonzero(~np.isnan(points).any(axis=1))
+            tree = self._trees[columns] = (KDTree(points[rows]), rows)
+        return tree
+
+    def source(self, name):
+        """Tag of the catalog that provided the row name ("" if untagged)."""
+        if self._source_of is None:
+            if name not in self:
+                raise KeyError(name)
+            return self.sources[0] if self.sources else ""
+        return self.sources[self._source_of[self._position(name)]]
+
+    # --- Ordering and text search ---
+    def natural_order(self):
+        """Size names in natural sort order, computed once per table."""
+        if self._natural_order is None:
+            if self._natural_positions is not None:
+                names = self.names
+                self._natural_order = [names[i] for i in np.asarray(self._natural_positions).tolist()]
+            else:
+                self._natural_order = sorted(self.names, key=natural_sort_key)
+        return self._natural_order
+
+    def search_keys(self):
+        """
+        Normalized search text per name of natural_order(): the name followed
+        by the dimensions joined with 'x', e.g. 'va-20 20x5x4'.
+        """
+        if self._search_keys is None:
+            keys = []
+            width = len(self.columns)
+            for name in self.natural_order():
+                values = self.array[self._position(name), :width].tolist()
+                dims = "x".join(f"{v:g}" for v in values if v == v)  # skip NaN
+                keys.append(f"{normalize_search(name)} {dims}")
+            self._search_keys = keys
+        return self._search_keys
+
+    def search(self, text, positions=None):
+        """
+        Positions in natural_order() whose search key contains text, e.g.
+        '20x' or 'x7'. positions restricts the search to earlier matches.
+        """
+        text = normalize_search(text)
+        keys = self.search_keys()
+        if positions is None:
+            positions = range(len(keys))
+        if not text:
+            return list(positions)
+        return [i for i in positions if text in keys[i]]
+
+    # --- Queries ---
+    def in_range(self, **bounds):
+        """
+        Names of the rows with every given column within (low, high), both
+        inclusive; None leaves a side open. Ordered by the first column.
+        Example: table.in_range(d1=(20, 25), b=(7, 7))
+        """
+        if not bounds:
+            return list(self.names)
+        candidates = None
+        for column, (low, high) in bounds.items():
+            self._column_index(column)
+            order, values = self._column_sort(column)
+            start = 0 if low is None else np.searchsorted(values, low, side="left")
+            stop = len(values) if high is None else np.searchsorted(values, high, side="right")
+            if candidates is None or stop - start < len(candidates):
+                candidates = order[start:stop]
+        for column, (low, high) in bounds.items():
+            values = self.array[candidates, self._column_index(column)]
+            keep = ~np.isnan(values)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            candidates = candidates[keep]
+        first = self.array[candidates, self._column_index(next(iter(bounds)))]
+        candidates = candidates[np.argsort(first, kind="stable")]
+        return [self.names[i] for i in candidates]
+
+    def nearest(self, k=1, **target):
+        """
+        The k rows closest to the given column values (Euclidean distance in
+        table units), as [(name, distance), ...] closest first.
+        Example: table.nearest(d1=23.4, d2=40)
+        """
+        if not target:
+            raise ValueError("nearest() needs at least one column value")
+        columns = tuple(c for c in self.columns if c in target)
+        unknown = set(target) - set(columns)
+        if unknown:
+            raise KeyError(f"Unknown column: {sorted(unknown)[0]}")
+        tree, rows = self._tree(columns)
+        point = [target[c] for c in columns]
+        return [(self.names[rows[i]], dist) for dist, i in tree.query(point, k)]
+
+
+def merge_tables(sources):
+    """
+    Merge [(tag, table), ...], ordered from lowest to highest priority, into
+    one table with the columns of the first. A size name that occurs in
+    several tables takes its values from the last one. Every table must
+    contain those columns; the merged table reports each row's tag through
+    source().
+    """
+    if len(sources) == 1:
+        tag, table = sources[0]
+        table.sources = [tag]
+        return table
+    columns = list(sources[0][1].columns)
+    winners = {}
+    for k, (_, table) in enumerate(sources):
+        for i, name in enumerate(table.names):
+            winners[name] = (k, i)
+    names = list(winners)
+    source_of = np.array([k for k, _ in winners.values()], dtype=np.int32)
+    source_rows = np.array([i for _, i in winners.values()], dtype=np.int64)
+    array = np.full((len(names), len(columns)), np.nan)
+    text = {}
+    for k, (_, table) in enumerate(sources):
+        positions = np.flatnonzero(source_of == k)
+        if not len(positions):
+            continue
+        rows = source_rows[positions]
+        cols = [table._column_index(c) for c in columns]
+        array[positions] = np.asarray(table.array)[rows][:, cols]
+        for j, c in enumerate(cols):
+            cells = table._text.get(c)
+            if cells is None:
+                continue
+            if j not in text:
+                text[j] = [np.nan] * len(names)
+            for n, i in zip(positions.tolist(), rows.tolist()):
+                text[j][n] = cells[i]
+    merged = SizeTable.from_arrays(names, columns, array, text)
+    merged.sources = [tag for tag, _ in sources]
+    merged._source_of = source_of
+    return merged
+
+
+# --- Compiled catalogs ----------------------------------------------------------
+# A compiled table is a directory holding
+#     values.npy - (width, rows) float64, one contiguous block per column
+#     index.npy  - (columns + 1, rows) int64: the row order of each column
+#                  (rows without a number last) followed by the natural order
+#     meta.json  - source file stamp, names, columns and the cells of
+#                  columns with non-numeric values
+# meta.json is written last, so a directory without it is ignored.
+CACHE_FORMAT = 1
+
+
+def file_digest(path):
+    """SHA-1 of a file's content."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_stamp(path):
+    """Modification time and size of a source file, plus its content hash."""
+    stat = os.stat(path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha1": file_digest(path)}
+
+
+def _write_atomic(path, write):
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as f:
+            write(f)
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def save_compiled(table, directory, stamp):
+    """Write table to directory; stamp identifies the source (see source_stamp)."""
+    os.makedirs(directory, exist_ok=True)
+    count = len(table)
+    width = table.array.shape[1]
+    index = np.empty((len(table.columns) + 1, count), dtype=np.int64)
+    counts = []
+    for j, column in enumerate(table.columns):
+        order = np.asarray(table._orders[column])
+        missing = np.setdiff1d(np.arange(count), order, assume_unique=True)
+        index[j] = np.concatenate([order, missing])
+        counts.append(len(order))
+    index[-1] = [table._position(name) for name in table.natural_order()]
+    widths = table._widths
+    meta = {
+        "format": CACHE_FORMAT,
+        "source": stamp,
+        "names": table.names,
+        "columns": table.columns,
+        "counts": counts,
+        "widths": None if widths is None or all(w == width for w in widths) else list(widths),
+        "text": {str(j): cells for j, cells in table._text.items()},
+    }
+    _write_atomic(
+        os.path.join(directory, "values.npy"),
+        lambda f: np.save(f, np.ascontiguousarray(table.array.T, dtype=np.float64)),
+    )
+    _write_atomic(os.path.join(directory, "index.npy"), lambda f: np.save(f, index))
+    _write_meta(directory, meta)
+
+
+def _write_meta(directory, meta):
+    data = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    _write_atomic(os.path.join(directory, "meta.json"), lambda f: f.write(data))
+
+
+def load_compiled(directory, path):
+    """
+    Memory-map the compiled table in directory, or return None when it is
+    missing or stale. A source with a new modification time but the same
+    content hash keeps its compiled table.
+    """
+    try:
+        with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != CACHE_FORMAT:
+            return None
+        stat = os.stat(path)
+        source = meta["source"]
+        if (source["mtime_ns"], source["size"]) != (stat.st_mtime_ns, stat.st_size):
+            if source["size"] != stat.st_size or source["sha1"] != file_digest(path):
+                return None
+            # Touched but unchanged, e.g. by a checkout
+            source["mtime_ns"] = stat.st_mtime_ns
+            try:
+                _write_meta(directory, meta)
+            except OSError:
+                pass
+        values = np.load(os.path.join(directory, "values.npy"), mmap_mode="r")
+        index = np.load(os.path.join(directory, "index.npy"), mmap_mode="r")
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    columns = meta["columns"]
+    orders = [index[j, :n] for j, n in enumerate(meta["counts"])]
+    text = {int(j): cells for j, cells in meta["text"].items()}
+    return SizeTable.from_arrays(
+        meta["names"], columns, values.T, text, meta["widths"], orders, index[len(columns)]
+    )
+
+
+def compiled_dir(cache_dir, path):
+    """Directory of the compiled table of the source file path."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    key = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{stem}-{key}")
+
+
+def cached_table(path, cache_dir, parse):
+    """
+    Return the table of the source file path, memory-mapped from its
+    compiled copy under cache_dir when that is current. Otherwise the file
+    is read with parse(path) -> SizeTable and compiled for the next time.
+    """
+    directory = compiled_dir(cache_dir, path)
+    table = load_compiled(directory, path)
+    if table is None:
+        stamp = source_stamp(path)
+        table = parse(path)
+        if len(table):
+            try:
+                save_compiled(table, directory, stamp)
+            except OSError:
+                pass  # Read-only cache location, parse again next time
+    return table
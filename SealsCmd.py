@@ -1,17 +1,43 @@
 # -*- coding: utf-8 -*-
 import FreeCAD
 import FreeCADGui
-import SealsGui
 import SealsUtils
-import SealsBase
 import SealsLocale
-import SealsMaker
+import SealsTiming
+
+# SealsGui, SealsBase and SealsMaker (PySide, Part, NumPy, the seal tables)
+# are imported inside the commands so that registering them stays cheap.
 
 ORING_ID = "oring"
 SHAFT_ID = "shaft_seal"
 VRING_ID = "vring"
 USIT_ID = "usit"
 
+
+def show_panel(edit_object=None, selected_type=None):
+    """Open the seal task panel, replacing one that is already open."""
+    with SealsTiming.measure("command.first"):
+        import SealsGui
+
+        if SealsGui.panel:
+            # reject() also stops the live preview of the open panel
+            SealsGui.panel.reject()
+        SealsGui.panel = SealsGui.create_panel(edit_object=edit_object, selected_type=selected_type)
+        FreeCADGui.Control.showDialog(SealsGui.panel)
+
+
+# --- Observer ---
+class SelectionObserver:
+    def addSelection(self, doc, obj, sub, pos):
+        pass
+
+    def removeSelection(self, doc, obj, sub):
+        pass
+
+    def clearSelection(self, doc):
+        pass
+
+
 class CreateORingCommand:
     def GetResources(self):
         return {
@@ -20,10 +46,7 @@ class CreateORingCommand:
             'ToolTip': SealsLocale.tr("cmd.tt.create_oring")
         }
     def Activated(self):
-        if SealsGui.panel:
-            FreeCADGui.Control.closeDialog()
-        SealsGui.panel = SealsGui.SealTaskPanel(selected_type=ORING_ID)
-        FreeCADGui.Control.showDialog(SealsGui.panel)
+        show_panel(selected_type=ORING_ID)
     def IsActive(self): return True
 
 class CreateShaftSealCommand:
@@ -34,10 +57,7 @@ class CreateShaftSealCommand:
             'ToolTip': SealsLocale.tr("cmd.tt.create_shaft")
         }
     def Activated(self):
-        if SealsGui.panel:
-            FreeCADGui.Control.closeDialog()
-        SealsGui.panel = SealsGui.SealTaskPanel(selected_type=SHAFT_ID)
-        FreeCADGui.Control.showDialog(SealsGui.panel)
+        show_panel(selected_type=SHAFT_ID)
     def IsActive(self): return True
 
 class CreateVRingCommand:
@@ -48,10 +68,7 @@ class CreateVRingCommand:
             'ToolTip': SealsLocale.tr("cmd.tt.create_vring")
         }
     def Activated(self):
-        if SealsGui.panel:
-            FreeCADGui.Control.closeDialog()
-        SealsGui.panel = SealsGui.SealTaskPanel(selected_type=VRING_ID)
-        FreeCADGui.Control.showDialog(SealsGui.panel)
+        show_panel(selected_type=VRING_ID)
     def IsActive(self): return True
 
 class CreateUsitRingCommand:
@@ -62,10 +79,7 @@ class CreateUsitRingCommand:
             'ToolTip': SealsLocale.tr("cmd.tt.create_usit")
         }
     def Activated(self):
-        if SealsGui.panel:
-            FreeCADGui.Control.closeDialog()
-        SealsGui.panel = SealsGui.SealTaskPanel(selected_type=USIT_ID)
-        FreeCADGui.Control.showDialog(SealsGui.panel)
+        show_panel(selected_type=USIT_ID)
     def IsActive(self): return True
 
 class ChangeSealParametersCommand:
@@ -78,11 +92,7 @@ class ChangeSealParametersCommand:
     def Activated(self):
         sel = FreeCADGui.Selection.getSelection()
         if not sel: return
-        obj = sel[0]
-        if SealsGui.panel:
-            FreeCADGui.Control.closeDialog()
-        SealsGui.panel = SealsGui.SealTaskPanel(edit_object=obj)
-        FreeCADGui.Control.showDialog(SealsGui.panel)
+        show_panel(edit_object=sel[0])
 
     def IsActive(self):
         sel = FreeCADGui.Selection.getSelection()
@@ -99,6 +109,8 @@ class DuplicateSealCommand:
         }
     
     def Activated(self):
+        import SealsBase
+
         sel = FreeCADGui.Selection.getSelection()
         if not sel: return
         orig = sel[0]
@@ -121,6 +133,152 @@ class DuplicateSealCommand:
         sel = FreeCADGui.Selection.getSelection()
         return len(sel) == 1 and hasattr(sel[0], "SealType")
 
+def _seal_source(obj):
+    """Return the seal object behind obj, following App::Link chains."""
+    target = obj.getLinkedObject(True) if hasattr(obj, "getLinkedObject") else obj
+    return target if hasattr(target, "SealType") else None
+
+
+def _link_spacing(orig):
+    """Offset between linked instances so they do not overlap the source."""
+    try:
+        return orig.Shape.BoundBox.XLength + 5.0
+    except Exception:
+        return 20.0
+
+
+class LinkSealCommand:
+    def GetResources(self):
+        return {
+            'Pixmap': SealsUtils.get_icon("icon_duplicate.svg"),
+            'MenuText': SealsLocale.tr("cmd.link_seal"),
+            'ToolTip': SealsLocale.tr("cmd.tt.link_seal")
+        }
+
+    def Activated(self):
+        sel = FreeCADGui.Selection.getSelection()
+        if not sel: return
+        orig = _seal_source(sel[0])
+        if not orig: return
+
+        doc = sel[0].Document
+        doc.openTransaction("Link Seal")
+        link = doc.addObject("App::Link", f"{orig.Name}Link")
+        link.setLink(orig)
+        link.Label = orig.Label
+        placement = sel[0].Placement.copy()
+        placement.Base.x += _link_spacing(orig)
+        link.Placement = placement
+        doc.commitTransaction()
+        doc.recompute()
+
+    def IsActive(self):
+        sel = FreeCADGui.Selection.getSelection()
+        return len(sel) == 1 and _seal_source(sel[0]) is not None
+
+class LinkSealArrayCommand:
+    def GetResources(self):
+        return {
+            'Pixmap': SealsUtils.get_icon("icon_duplicate.svg"),
+            'MenuText': SealsLocale.tr("cmd.link_array"),
+            'ToolTip': SealsLocale.tr("cmd.tt.link_array")
+        }
+
+    def Activated(self):
+        sel = FreeCADGui.Selection.getSelection()
+        if not sel: return
+        orig = _seal_source(sel[0])
+        if not orig: return
+
+        from PySide import QtGui
+
+        count, ok = QtGui.QInputDialog.getInt(
+            FreeCADGui.getMainWindow(),
+            SealsLocale.tr("cmd.link_array"),
+            SealsLocale.tr("ui.array_count"),
+            10, 1, 1000,
+        )
+        if not ok: return
+
+        doc = sel[0].Document
+        doc.openTransaction("Link Seal Array")
+        arr = doc.addObject("App::Link", f"{orig.Name}Array")
+        arr.setLink(orig)
+        arr.Label = orig.Label
+        arr.Placement = sel[0].Placement
+        arr.ElementCount = count
+        spacing = _link_spacing(orig)
+        arr.PlacementList = [
+            FreeCAD.Placement(FreeCAD.Vector(spacing * (i + 1), 0, 0), FreeCAD.Rotation())
+            for i in range(count)
+        ]
+        # Without element objects the array is a single object in the tree
+        arr.ShowElement = False
+        doc.commitTransaction()
+        doc.recompute()
+
+    def IsActive(self):
+        sel = FreeCADGui.Selection.getSelection()
+        return len(sel) == 1 and _seal_source(sel[0]) is not None
+
+class SetDetailLevelCommand:
+    def GetResources(self):
+        return {
+            'Pixmap': SealsUtils.get_icon("icon_workbench.svg"),
+            'MenuText': SealsLocale.tr("cmd.detail_level"),
+            'ToolTip': SealsLocale.tr("cmd.tt.detail_level")
+        }
+
+    def Activated(self):
+        from PySide import QtGui
+        import SealsBase
+        import SealsMaker
+
+        doc = FreeCAD.ActiveDocument
+        if not doc: return
+        levels = SealsMaker.DETAIL_LEVELS
+        current = SealsBase.get_document_detail_level(doc)
+        level, ok = QtGui.QInputDialog.getItem(
+            FreeCADGui.getMainWindow(),
+            SealsLocale.tr("cmd.detail_level"),
+            SealsLocale.tr("ui.detail_level"),
+            levels, levels.index(current), False,
+        )
+        if not ok or level == current: return
+        SealsBase.set_document_detail_level(doc, level)
+
+    def IsActive(self):
+        return FreeCAD.ActiveDocument is not None
+
+class ClearSealsCacheCommand:
+    def GetResources(self):
+        return {
+            'Pixmap': SealsUtils.get_icon("icon_workbench.svg"),
+            'MenuText': SealsLocale.tr("cmd.clear_cache"),
+            'ToolTip': SealsLocale.tr("cmd.tt.clear_cache")
+        }
+
+    def Activated(self):
+        import SealsMaker
+
+        SealsMaker.Instance.clear_cache(disk=True)
+        FreeCAD.Console.PrintMessage("SealsWorkbench: Shape cache cleared.\n")
+
+    def IsActive(self): return True
+
+class StartupTimingCommand:
+    def GetResources(self):
+        return {
+            'Pixmap': SealsUtils.get_icon("icon_workbench.svg"),
+            'MenuText': SealsLocale.tr("cmd.startup_timing"),
+            'ToolTip': SealsLocale.tr("cmd.tt.startup_timing")
+        }
+
+    def Activated(self):
+        FreeCAD.Console.PrintMessage(SealsTiming.report())
+
+    def IsActive(self): return True
+
 def register_commands():
     FreeCADGui.addCommand("CreateORing", CreateORingCommand())
     FreeCADGui.addCommand("CreateShaftSeal", CreateShaftSealCommand())
@@ -128,3 +286,8 @@ def register_commands():
     FreeCADGui.addCommand("CreateUsitRing", CreateUsitRingCommand())
     FreeCADGui.addCommand("ChangeSealParameters", ChangeSealParametersCommand())
     FreeCADGui.addCommand("DuplicateSeal", DuplicateSealCommand())
+    FreeCADGui.addCommand("LinkSeal", LinkSealCommand())
+    FreeCADGui.addCommand("LinkSealArray", LinkSealArrayCommand())
+    FreeCADGui.addCommand("SetSealsDetailLevel", SetDetailLevelCommand())
+    FreeCADGui.addCommand("ClearSealsCache", ClearSealsCacheCommand())
+    FreeCADGui.addCommand("SealsStartupTiming", StartupTimingCommand())
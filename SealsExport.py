@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+SealsExport.py
+
+Headless catalog exporter. Writes every standard size of every seal type to
+STEP and/or BREP files and records them in a manifest with SHA-256 checksums.
+Finished files are listed in the manifest as soon as they are written, so an
+interrupted export continues where it stopped when run again.
+
+Usage:
+    Run with FreeCAD's python executable:
+    <PathToFreeCAD>/bin/python SealsExport.py <OutputDir> [options]
+
+Options:
+    --format step,brep    File formats to write (default: step); "profile" writes
+                          the 2D cross-section as JSON without building solids
+    --types oring,usit    Seal type ids to export (default: all)
+    --workers N           Worker processes (default: CPU count, 1 = in-process)
+    --freecad-lib PATH    Directory containing FreeCAD.so/.pyd if not on sys.path
+    --force               Regenerate files that are already in the manifest
+    --verify              Re-check checksums of existing files before skipping
+    --optimize-topology   Merge faces of the solids before writing (fewer faces)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+FORMATS = ("step", "brep", "profile")
+
+# Seconds between manifest snapshots while exporting
+_SAVE_INTERVAL = 2.0
+
+
+def safe_file_name(name):
+    """Turn a size key like 'M3 (3.6x7.5)' into 'M3_3.6x7.5'."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_") or "unnamed"
+
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(out_dir):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable manifest {path}: {e}")
+    return {"version": MANIFEST_VERSION, "items": {}, "errors": {}}
+
+
+def save_manifest(out_dir, manifest):
+    """Write the manifest atomically so an interruption never leaves it broken."""
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_complete(entry, out_dir, formats, verify=False):
+    """Return True if every requested file of a manifest entry is intact."""
+    if not entry:
+        return False
+    files = entry.get("files", {})
+    for fmt in formats:
+        info = files.get(fmt)
+        if not info:
+            return False
+        path = os.path.join(out_dir, info["path"])
+        if not os.path.exists(path) or os.path.getsize(path) != info.get("size"):
+            return False
+        if verify and file_checksum(path) != info.get("sha256"):
+            return False
+    return True
+
+
+def collect_jobs(maker, type_ids=None):
+    """
+    Yield (item_id, type_id, name, dims) for every catalog row. Size keys that
+    map to the same file name, e.g. 'M3 (3.6x7.5)' and 'M3 3.6x7.5', get a
+    short hash of the key appended so that their files do not overwrite each
+    other.
+    """
+    for type_id, definition in maker.all_definitions():
+        if type_ids and type_id not in type_ids:
+            continue
+        count = len(definition["properties"])
+        data = definition["data"]
+        names = data.natural_order()
+        file_names = [safe_file_name(name) for name in names]
+        taken = {}
+        for file_name in file_names:
+            taken[file_name] = taken.get(file_name, 0) + 1
+        for name, file_name in zip(names, file_names):
+            if taken[file_name] > 1:
+                file_name += "_" + hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+            dims = tuple(float(v) for v in data[name][:count])
+            yield f"{type_id}/{file_name}", type_id, name, dims
+
+
+def export_one(job):
+    """
+    Build one seal and write its files. Runs in worker processes.
+    Returns (item_id, entry, error).
+    """
+    item_id, type_id, name, dims, out_dir, formats, optimized = job
+    try:
+        import SealsProfiles
+
+        section = SealsProfiles.section(type_id, dims)
+        if section is None:
+            return item_id, None, f"Invalid dimensions: {dims}"
+        shape = None
+        if set(formats) - {"profile"}:
+            import SealsMaker
+
+            shape = SealsMaker.Instance.make_shape(type_id, dims, optimized=optimized)
+            if shape.isNull():
+                return item_id, None, f"Invalid dimensions: {dims}"
+        files = {}
+        for fmt in formats:
+            rel_path = f"{item_id}.{'json' if fmt == 'profile' else fmt}"
+            path = os.path.join(out_dir, rel_path)
+            tmp_path = f"{path}.tmp.{fmt}"
+            if fmt == "step":
+                shape.exportStep(tmp_path)
+            elif fmt == "brep":
+                shape.exportBrep(tmp_path)
+            else:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(dict(section.to_dict(), name=name), f)
+            os.replace(tmp_path, path)
+            files[fmt] = {
+                "path": rel_path,
+                "sha256": file_checksum(path),
+                "size": os.path.getsize(path),
+            }
+        entry = {"type": type_id, "name": name, "dims": list(dims), "files": files}
+        if optimized:
+            entry["optimized"] = True
+        return item_id, entry, None
+    except Exception as e:
+        return item_id, None, str(e)
+
+
+def export_catalog(
+    out_dir, formats=("step",), type_ids=None, workers=None, force=False, verify=False, optimized=False
+):
+    """
+    Export the catalog into out_dir. Returns (written, skipped, failed) counts.
+    Raises ValueError for unsupported formats and unknown seal type ids.
+    """
+    import SealsMaker
+    import SealsUtils
+
+    formats = tuple(formats)
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt} (supported: {', '.join(FORMATS)})")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    maker = SealsMaker.Instance
+    if type_ids:
+        known = [type_id for type_id, _ in maker.all_definitions()]
+        unknown = sorted(set(type_ids) - set(known))
+        if unknown:
+            raise ValueError(f"Unknown seal type(s): {', '.join(unknown)} (known: {', '.join(known)})")
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    manifest["formats"] = sorted(set(manifest.get("formats", [])) | set(formats))
+    items = manifest["items"]
+    errors = manifest["errors"]
+
+    jobs = []
+    skipped = 0
+    for item_id, type_id, name, dims in collect_jobs(maker, type_ids):
+        entry = items.get(item_id)
+        if (
+            not force
+            and entry
+            and entry.get("dims") == list(dims)
+            and entry.get("optimized", False) == optimized
+            and is_complete(entry, out_dir, formats, verify)
+        ):
+            skipped += 1
+            continue
+        jobs.append((item_id, type_id, name, dims, out_dir, formats, optimized))
+    for type_id in {job[1] for job in jobs}:
+        os.makedirs(os.path.join(out_dir, type_id), exist_ok=True)
+
+    if workers > 1 and len(jobs) > 1 and not SealsUtils.headless_python():
+        print("No headless FreeCAD interpreter found, exporting in this process")
+        workers = 1
+    print(f"Exporting {len(jobs)} seals ({skipped} already done) with {workers} worker(s)...")
+    written = 0
+    failed = 0
+    last_save = time.monotonic()
+
+    def record(result):
+        nonlocal written, failed, last_save
+        item_id, entry, error = result
+        if error:
+            failed += 1
+            errors[item_id] = error
+            print(f"  FAILED {item_id}: {error}")
+        else:
+            written += 1
+            previous = items.get(item_id, {}).get("files", {})
+            entry["files"] = dict(previous, **entry["files"])
+            items[item_id] = entry
+            errors.pop(item_id, None)
+        if time.monotonic() - last_save > _SAVE_INTERVAL:
+            save_manifest(out_dir, manifest)
+            last_save = time.monotonic()
+
+    try:
+        if workers <= 1 or len(jobs) <= 1:
+            for job in jobs:
+                record(export_one(job))
+        else:
+            chunksize = max(1, len(jobs) // (workers * 8))
+            with SealsUtils.create_process_pool(min(workers, len(jobs))) as pool:
+                for result in pool.map(export_one, jobs, chunksize=chunksize):
+                    record(result)
+    finally:
+        save_manifest(out_dir, manifest)
+    return written, skipped, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the seal catalog to STEP/BREP files.")
+    parser.add_argument("output", help="Output directory")
+    parser.add_argument("--format", default="step", help="Comma separated formats: step, brep, profile")
+    parser.add_argument("--types", default="", help="Comma separated seal type ids (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--freecad-lib", default="", help="Directory containing the FreeCAD module")
+    parser.add_argument("--force", action="store_true", help="Regenerate existing files")
+    parser.add_argument("--verify", action="store_true", help="Verify checksums of existing files")
+    parser.add_argument("--optimize-topology", action="store_true", help="Write solids with merged faces")
+    args = parser.parse_args(argv)
+
+    if args.freecad_lib and args.freecad_lib not in sys.path:
+        sys.path.append(args.freecad_lib)
+    here = os.path.dirname(os.path.abspath(__file__))
+    if here not in sys.path:
+        sys.path.append(here)
+
+    formats = [f.strip().lower() for f in args.format.split(",") if f.strip()]
+    type_ids = {t.strip() for t in args.types.split(",") if t.strip()} or None
+
+    start = time.perf_counter()
+    try:
+        written, skipped, failed = export_catalog(
+            os.path.abspath(args.output),
+            formats=formats,
+            type_ids=type_ids,
+            workers=args.workers,
+            force=args.force,
+            verify=args.verify,
+            optimized=args.optimize_topology,
+        )
+    except ValueError as e:
+        # Unsupported formats or unknown seal types
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+    print(f"Done in {elapsed:.1f} s: {written} written, {skipped} skipped, {failed} failed.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+O-ring groove calculator over the DIN 3771 size table.
+
+For a given groove every O-ring of the table is rated at once with NumPy:
+    stretch  - change of the inner diameter when mounted (negative = compressed)
+    squeeze  - radial (or axial) compression of the cross-section
+    fill     - share of the groove cross-section taken by the O-ring
+The cross-section of a stretched ring shrinks as d2 / sqrt(1 + stretch)
+(constant volume). All lengths in mm, results in percent.
+
+Housings:
+    piston - radial, groove on the inner part (groove_diameter = groove bottom,
+             mating_diameter = bore)
+    rod    - radial, groove in the bore (groove_diameter = groove bottom,
+             mating_diameter = rod; the ring sits on the rod)
+    axial  - face groove under internal pressure (groove_diameter = outer
+             groove diameter, depth required)
+"""
+from collections import namedtuple
+
+import numpy as np
+import SealsMaker
+
+HOUSINGS = ("piston", "rod", "axial")
+SERVICES = ("static", "dynamic")
+
+# Recommended ranges in percent
+SQUEEZE_LIMITS = {"static": (15.0, 30.0), "dynamic": (10.0, 20.0)}
+STRETCH_LIMITS = {"piston": (0.0, 5.0), "rod": (-3.0, 1.0), "axial": (-3.0, 1.0)}
+MAX_FILL = 85.0
+
+GrooveFit = namedtuple("GrooveFit", ["name", "d1", "d2", "squeeze", "fill", "stretch", "score"])
+
+
+def groove_depth(housing, mating_diameter, groove_diameter):
+    """Radial gland depth of a piston or rod groove."""
+    if housing == "piston":
+        return (mating_diameter - groove_diameter) / 2.0
+    if housing == "rod":
+        return (groove_diameter - mating_diameter) / 2.0
+    raise ValueError(f"Groove depth of {housing!r} housings must be given")
+
+
+def evaluate(d1, d2, housing, groove_diameter, depth, width, mating_diameter=None):
+    """
+    Rate O-rings (d1 inner diameter, d2 cross-section, scalars or arrays) in
+    one groove. Rod housings need the rod diameter as mating_diameter.
+    Returns {"stretch", "squeeze", "fill"} arrays in percent.
+    """
+    if housing not in HOUSINGS:
+        raise ValueError(f"Unknown housing: {housing}")
+    d1 = np.asarray(d1, dtype=float)
+    d2 = np.asarray(d2, dtype=float)
+    # Inner diameter of the mounted ring
+    if housing == "piston":
+        mounted = np.full_like(d1, groove_diameter)
+    elif housing == "rod":
+        mounted = np.full_like(d1, mating_diameter)
+    else:
+        # Outer diameter rests against the outer groove wall
+        mounted = groove_diameter - 2.0 * d2
+    stretch = (mounted - d1) / d1
+    section = d2 / np.sqrt(1.0 + np.maximum(stretch, -0.5))
+    squeeze = (section - depth) / section * 100.0
+    fill = np.pi / 4.0 * section ** 2 / (depth * width) * 100.0
+    return {"stretch": stretch * 100.0, "squeeze": squeeze, "fill": fill}
+
+
+def fit_mask(values, housing, service):
+    """Boolean mask of the entries within the recommended ranges."""
+    sq_min, sq_max = SQUEEZE_LIMITS[service]
+    st_min, st_max = STRETCH_LIMITS[housing]
+    return (
+        (values["squeeze"] >= sq_min)
+        & (values["squeeze"] <= sq_max)
+        & (values["stretch"] >= st_min)
+        & (values["stretch"] <= st_max)
+        & (values["fill"] <= MAX_FILL)
+    )
+
+
+def score(values, housing, service):
+    """Distance from the middle of the recommended ranges, lower is better."""
+    sq_min, sq_max = SQUEEZE_LIMITS[service]
+    st_min, st_max = STRETCH_LIMITS[housing]
+    return (
+        np.abs(values["squeeze"] - (sq_min + sq_max) / 2.0) / (sq_max - sq_min)
+        + np.abs(values["stretch"] - (st_min + st_max) / 2.0) / (st_max - st_min)
+        + values["fill"] / MAX_FILL * 0.1
+    )
+
+
+def find_orings(housing, service, groove_diameter, width, mating_diameter=None, depth=None, limit=None):
+    """
+    Return the O-rings of the DIN 3771 table that fit the groove as a list of
+    GrooveFit, best first. Radial grooves derive depth from mating_diameter.
+    """
+    if service not in SERVICES:
+        raise ValueError(f"Unknown service: {service}")
+    if depth is None:
+        depth = groove_depth(housing, mating_diameter, groove_diameter)
+    if depth <= 0 or width <= 0:
+        raise ValueError("Groove depth and width must be positive")
+
+    data = SealsMaker.Instance.get_definition("oring")["data"]
+    names = data.natural_order()
+    if not names:
+        return []
+    dims = np.array([data[name][:2] for name in names], dtype=float)
+    values = evaluate(dims[:, 0], dims[:, 1], housing, groove_diameter, depth, width, mating_diameter)
+    scores = score(values, housing, service)
+    indices = np.flatnonzero(fit_mask(values, housing, service))
+    indices = indices[np.argsort(scores[indices], kind="stable")]
+    if limit is not None:
+        indices = indices[:limit]
+    return [
+        GrooveFit(
+            names[i],
+            float(dims[i, 0]),
+            float(dims[i, 1]),
+            float(values["squeeze"][i]),
+            float(values["fill"][i]),
+            float(values["stretch"][i]),
+            float(scores[i]),
+        )
+        for i in indices
+    ]
@@ -1,15 +1,213 @@
 # -*- coding: utf-8 -*-
 import FreeCAD
 import FreeCADGui
-from PySide import QtCore, QtGui
+from PySide import QtCore, QtGui, QtSvg
 import SealsMaker
 import SealsBase
 import SealsUtils
 import SealsLocale
+import SealsGroove
+import SealsCatalog
+import SealsPreview
+import SealsTiming
 import os
 
 # Global reference to keep window alive
 panel = None
+# Panel built ahead of time by prewarm(), handed out by create_panel()
+_prebuilt = None
+# Rendered preview images: (image name, size, device pixel ratio) -> QPixmap
+_preview_cache = {}
+# Parameter forms shared by all panels: type_id -> (form widget, inputs).
+# A panel takes a form into its stack when shown and hands it back on close.
+_param_forms = {}
+# The panel whose inputs the forms currently edit
+_form_owner = None
+PREVIEW_SIZE = 320
+
+
+def preview_pixmap(name, size=PREVIEW_SIZE, dpr=1.0):
+    """
+    Return the preview image name rendered to fit size x size logical pixels,
+    or None if the file does not exist. SVGs are rendered directly at the
+    target resolution; results are cached for the whole session.
+    """
+    key = (name, size, round(dpr, 2))
+    if key in _preview_cache:
+        return _preview_cache[key]
+    path = SealsUtils.get_icon(name)
+    pixmap = None
+    if os.path.exists(path):
+        pixels = int(round(size * dpr))
+        renderer = QtSvg.QSvgRenderer(path) if path.lower().endswith(".svg") else None
+        if renderer is not None and renderer.isValid():
+            target = renderer.defaultSize()
+            target.scale(pixels, pixels, QtCore.Qt.KeepAspectRatio)
+            image = QtGui.QImage(target, QtGui.QImage.Format_ARGB32_Premultiplied)
+            image.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(image)
+            renderer.render(painter)
+            painter.end()
+            pixmap = QtGui.QPixmap.fromImage(image)
+        else:
+            pixmap = QtGui.QPixmap(path).scaled(
+                pixels, pixels, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+            )
+        pixmap.setDevicePixelRatio(dpr)
+    _preview_cache[key] = pixmap
+    return pixmap
+
+
+def prewarm():
+    """Build a task panel with all parameter forms while the GUI is idle."""
+    global _prebuilt
+    if _prebuilt is None:
+        with SealsTiming.measure("panel.prewarm"):
+            _prebuilt = SealTaskPanel(defer_setup=True)
+            _prebuilt.prebuild_forms()
+
+
+def prewarm_enabled():
+    return SealsUtils.get_params().GetBool("PrewarmTaskPanel", False)
+
+
+def schedule_prewarm():
+    """Build the next task panel while idle if the PrewarmTaskPanel preference is on."""
+    if prewarm_enabled():
+        QtCore.QTimer.singleShot(0, prewarm)
+
+
+def _widget_alive(widget):
+    try:
+        widget.objectName()
+    except RuntimeError:  # The C++ widget was deleted
+        return False
+    return True
+
+
+def param_form(maker, type_id):
+    """Return (widget, inputs) of the parameter form of type_id, built once per session."""
+    entry = _param_forms.get(type_id)
+    if entry is None or not _widget_alive(entry[0]):
+        definition = maker.get_definition(type_id)
+        widget = QtGui.QWidget()
+        layout = QtGui.QFormLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        validator = QtGui.QDoubleValidator(0.0, 10000.0, 3, widget)
+        inputs = {}
+        for prop in definition["properties"]:
+            short_label = SealsLocale.tr(prop["short_key"])
+            le = QtGui.QLineEdit()
+            le.setValidator(validator)
+            le.setToolTip(SealsLocale.tr(prop["tooltip_key"]))
+            le.textChanged.connect(_on_dimension_edited)
+            layout.addRow(QtGui.QLabel(f"{short_label}:"), le)
+            inputs[prop["name"]] = le
+        entry = _param_forms[type_id] = (widget, inputs)
+    return entry
+
+
+def _on_dimension_edited(_text):
+    if _form_owner is not None:
+        _form_owner.on_input_changed()
+        _form_owner.live_preview.schedule()
+
+
+def create_panel(edit_object=None, selected_type=None):
+    """Return a task panel for a seal, using the prebuilt one if available."""
+    global _prebuilt
+    new_panel, _prebuilt = _prebuilt, None
+    if new_panel is None:
+        new_panel = SealTaskPanel(defer_setup=True)
+    new_panel.setup(edit_object, selected_type)
+    return new_panel
+
+
+class SizeListModel(QtCore.QAbstractListModel):
+    """Standard sizes of one size table in natural order, "Custom" first."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.table = SealsCatalog.SizeTable({})
+        self.custom_label = "Custom"
+        self.extra = []  # sizes of edited objects that are not in the table
+
+    def set_table(self, table, custom_label):
+        self.beginResetModel()
+        self.table = table
+        self.custom_label = custom_label
+        self.extra = []
+        self.endResetModel()
+
+    def add_key(self, key):
+        row = self.rowCount()
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.extra.append(key)
+        self.endInsertRows()
+
+    def key(self, row):
+        if row == 0:
+            return "Custom"
+        names = self.table.natural_order()
+        row -= 1
+        return names[row] if row < len(names) else self.extra[row - len(names)]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 + len(self.table) + len(self.extra)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self.custom_label if index.row() == 0 else self.key(index.row())
+        if role == QtCore.Qt.UserRole:
+            return self.key(index.row())
+        if role == QtCore.Qt.ToolTipRole and len(self.table.sources) > 1:
+            key = self.key(index.row())
+            if key in self.table:
+                return SealsLocale.tr("ui.size_source").format(self.table.source(key))
+        return None
+
+
+class SizeFilterProxy(QtCore.QSortFilterProxyModel):
+    """
+    Filters a SizeListModel by a text fragment such as "20x" or "x7" using
+    the table's precomputed search keys. "Custom" always stays visible.
+    While typing, each longer fragment only searches the previous matches.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._table = None
+        self._text = ""
+        self._positions = None
+        self._accepted = None
+
+    def set_filter_text(self, text):
+        table = self.sourceModel().table
+        text = SealsCatalog.normalize_search(text)
+        if not text:
+            self._positions = None
+            self._accepted = None
+        else:
+            previous = None
+            if table is self._table and self._positions is not None and text.startswith(self._text):
+                previous = self._positions
+            self._positions = table.search(text, previous)
+            self._accepted = {p + 1 for p in self._positions}
+        self._table = table
+        self._text = text
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._accepted is None or source_row == 0:
+            return True
+        if source_row > len(self._table):
+            key = self.sourceModel().key(source_row)
+            return self._text in SealsCatalog.normalize_search(key)
+        return source_row in self._accepted
 
 
 class SealTaskPanel:
@@ -17,27 +215,20 @@ class SealTaskPanel:
     The Task Panel for creating/editing Seals.
     """
 
-    def __init__(self, edit_object=None, selected_type=None):
-        self.edit_object = edit_object
+    def __init__(self, edit_object=None, selected_type=None, defer_setup=False):
+        self.edit_object = None
         self.maker = SealsMaker.Instance
         self.dimension_inputs = {}
         self.ignore_changes = False  # Flag to prevent loops
-        self.selected_type_id = selected_type
-
-        if not self.selected_type_id and self.edit_object:
-            self.selected_type_id = self.maker.normalize_type_id(self.edit_object.SealType)
-        if not self.selected_type_id:
-            self.selected_type_id = next(iter(self.maker.definitions))
+        self.selected_type_id = None
 
         self.form = QtGui.QWidget()
         self.main_layout = QtGui.QVBoxLayout(self.form)
 
         # --- Header: Edit/Create indicator ---
-        header = QtGui.QLabel(
-            SealsLocale.tr("ui.editing") if self.edit_object else SealsLocale.tr("ui.creating")
-        )
-        header.setStyleSheet("font-weight: 600;")
-        self.main_layout.addWidget(header)
+        self.header = QtGui.QLabel()
+        self.header.setStyleSheet("font-weight: 600;")
+        self.main_layout.addWidget(self.header)
 
         # --- Row 1: Seal Type ---
         row1 = QtGui.QHBoxLayout()
@@ -51,9 +242,20 @@ class SealTaskPanel:
         row2 = QtGui.QHBoxLayout()
         row2.addWidget(QtGui.QLabel(f"{SealsLocale.tr('ui.standard_size')}:"))
         self.size_combo = QtGui.QComboBox()
-        self.size_combo.setEditable(True)  # Allow quick filter
         self.size_combo.setToolTip(SealsLocale.tr("ui.standard_size.tip"))
+        self.size_model = SizeListModel(self.form)
+        self.size_proxy = SizeFilterProxy(self.form)
+        self.size_proxy.setSourceModel(self.size_model)
+        self.size_combo.setModel(self.size_proxy)
         row2.addWidget(self.size_combo, stretch=1)
+        self.size_filter = QtGui.QLineEdit()
+        self.size_filter.setPlaceholderText(SealsLocale.tr("ui.size_filter"))
+        self.size_filter.setToolTip(SealsLocale.tr("ui.size_filter.tip"))
+        self.size_filter.setMaximumWidth(110)
+        row2.addWidget(self.size_filter)
+        self.nearest_button = QtGui.QPushButton(SealsLocale.tr("ui.nearest_size"))
+        self.nearest_button.setToolTip(SealsLocale.tr("ui.nearest_size.tip"))
+        row2.addWidget(self.nearest_button)
         self.main_layout.addLayout(row2)
 
         # --- Description / Use cases ---
@@ -67,6 +269,10 @@ class SealTaskPanel:
         details_layout.addWidget(self.usecases_label)
         self.main_layout.addWidget(self.details_group)
 
+        # --- O-ring groove calculator (O-rings only) ---
+        self.build_groove_panel()
+        self.main_layout.addWidget(self.groove_group)
+
         # --- Main Content (Image + Inputs) ---
         content_layout = QtGui.QHBoxLayout()
         self.main_layout.addLayout(content_layout)
@@ -78,9 +284,11 @@ class SealTaskPanel:
         self.preview_image.setStyleSheet("background: transparent;")
         content_layout.addWidget(self.preview_image, stretch=2)
 
-        # Inputs (Right)
+        # Inputs (Right), one cached form per seal type
         self.params_group = QtGui.QGroupBox(SealsLocale.tr("ui.parameters"))
-        self.inputs_layout = QtGui.QFormLayout(self.params_group)
+        params_layout = QtGui.QVBoxLayout(self.params_group)
+        self.params_stack = QtGui.QStackedWidget()
+        params_layout.addWidget(self.params_stack)
         content_layout.addWidget(self.params_group, stretch=1)
 
         # --- Buttons ---
@@ -92,17 +300,45 @@ class SealTaskPanel:
         # --- Signals ---
         self.type_combo.currentIndexChanged.connect(self.on_type_changed)
         self.size_combo.currentIndexChanged.connect(self.on_size_selected)
-        self.size_combo.editTextChanged.connect(self.on_size_filter)
+        self.size_filter.textChanged.connect(self.on_size_filter)
+        self.nearest_button.clicked.connect(self.on_nearest_size)
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
 
-        # --- Initialize ---
+        self.live_preview = SealsPreview.LivePreview(self.preview_request, self.form)
+
         self.populate_types()
+        if not defer_setup:
+            self.setup(edit_object, selected_type)
+
+    def setup(self, edit_object=None, selected_type=None):
+        """Prepare the panel for creating a seal of selected_type or editing edit_object."""
+        self.edit_object = edit_object
+        self.selected_type_id = selected_type
+        if not self.selected_type_id and self.edit_object:
+            self.selected_type_id = self.maker.normalize_type_id(self.edit_object.SealType)
+        if not self.selected_type_id:
+            self.selected_type_id = next(iter(self.maker.definitions))
+
+        self.header.setText(
+            SealsLocale.tr("ui.editing") if self.edit_object else SealsLocale.tr("ui.creating")
+        )
+        self.type_combo.setEnabled(True)
+        idx = self.type_combo.findData(self.selected_type_id)
+        if idx >= 0:
+            self.type_combo.blockSignals(True)
+            self.type_combo.setCurrentIndex(idx)
+            self.type_combo.blockSignals(False)
         if self.edit_object:
             self.init_edit_mode()
         else:
             self.on_type_changed()
 
+    def prebuild_forms(self):
+        """Build the parameter forms of all seal types ahead of use."""
+        for type_id in self.maker.definitions:
+            param_form(self.maker, type_id)
+
     # --- UI builders ---------------------------------------------------------
     def populate_types(self):
         self.type_combo.blockSignals(True)
@@ -115,6 +351,93 @@ class SealTaskPanel:
             self.type_combo.setCurrentIndex(idx)
         self.type_combo.blockSignals(False)
 
+    def param_form(self, type_id):
+        """Return (widget, inputs) of the shared form of type_id, shown in this panel."""
+        global _form_owner
+        entry = param_form(self.maker, type_id)
+        if self.params_stack.indexOf(entry[0]) < 0:
+            self.params_stack.addWidget(entry[0])
+        _form_owner = self
+        return entry
+
+    def release_forms(self):
+        """Hand the shared forms back before the task dialog deletes this panel's widgets."""
+        global _form_owner
+        if _form_owner is self:
+            _form_owner = None
+        for widget, _inputs in _param_forms.values():
+            if _widget_alive(widget) and self.params_stack.indexOf(widget) >= 0:
+                self.params_stack.removeWidget(widget)
+                widget.setParent(None)
+
+    def build_groove_panel(self):
+        self.groove_group = QtGui.QGroupBox(SealsLocale.tr("ui.groove"))
+        layout = QtGui.QVBoxLayout(self.groove_group)
+        form = QtGui.QFormLayout()
+        layout.addLayout(form)
+
+        self.groove_housing = QtGui.QComboBox()
+        for housing in SealsGroove.HOUSINGS:
+            self.groove_housing.addItem(SealsLocale.tr(f"ui.groove.{housing}"), housing)
+        form.addRow(f"{SealsLocale.tr('ui.groove.housing')}:", self.groove_housing)
+        self.groove_service = QtGui.QComboBox()
+        for service in SealsGroove.SERVICES:
+            self.groove_service.addItem(SealsLocale.tr(f"ui.groove.{service}"), service)
+        form.addRow(f"{SealsLocale.tr('ui.groove.service')}:", self.groove_service)
+
+        validator = QtGui.QDoubleValidator(0.0, 10000.0, 3)
+        self.groove_inputs = {}
+        for name in ("mating_diameter", "groove_diameter", "width", "depth"):
+            le = QtGui.QLineEdit()
+            le.setValidator(validator)
+            le.setToolTip(SealsLocale.tr(f"ui.groove.{name}.tip"))
+            form.addRow(f"{SealsLocale.tr(f'ui.groove.{name}')}:", le)
+            self.groove_inputs[name] = le
+
+        search_button = QtGui.QPushButton(SealsLocale.tr("ui.groove.search"))
+        search_button.clicked.connect(self.on_groove_search)
+        layout.addWidget(search_button)
+        self.groove_results = QtGui.QListWidget()
+        self.groove_results.setMaximumHeight(120)
+        self.groove_results.itemClicked.connect(self.on_groove_result_selected)
+        layout.addWidget(self.groove_results)
+
+    def _groove_value(self, name):
+        txt = self.groove_inputs[name].text().strip().replace(",", ".")
+        try:
+            return float(txt) if txt else None
+        except ValueError:
+            return None
+
+    def on_groove_search(self):
+        self.groove_results.clear()
+        try:
+            fits = SealsGroove.find_orings(
+                self.groove_housing.currentData(),
+                self.groove_service.currentData(),
+                groove_diameter=self._groove_value("groove_diameter") or 0.0,
+                width=self._groove_value("width") or 0.0,
+                mating_diameter=self._groove_value("mating_diameter"),
+                depth=self._groove_value("depth"),
+            )
+        except (TypeError, ValueError):
+            self.groove_results.addItem(SealsLocale.tr("ui.groove.invalid"))
+            return
+        if not fits:
+            self.groove_results.addItem(SealsLocale.tr("ui.groove.none"))
+        for fit in fits:
+            text = SealsLocale.tr("ui.groove.result").format(
+                name=fit.name, squeeze=fit.squeeze, fill=fit.fill, stretch=fit.stretch
+            )
+            item = QtGui.QListWidgetItem(text)
+            item.setData(QtCore.Qt.UserRole, fit.name)
+            self.groove_results.addItem(item)
+
+    def on_groove_result_selected(self, item):
+        size_key = item.data(QtCore.Qt.UserRole)
+        if size_key:
+            self.select_size(size_key)
+
     def _current_type_id(self):
         return self.type_combo.currentData() or self.selected_type_id
 
@@ -128,13 +451,10 @@ class SealTaskPanel:
         self.on_type_changed()
 
         current_size = self.edit_object.StandardSize
-        idx = self.size_combo.findData(current_size)
-        if idx >= 0:
-            self.size_combo.setCurrentIndex(idx)
-        else:
+        if not self.select_size(current_size):
             # add ad-hoc if not present
-            self.size_combo.addItem(str(current_size), current_size)
-            self.size_combo.setCurrentIndex(self.size_combo.count() - 1)
+            self.size_model.add_key(str(current_size))
+            self.select_size(str(current_size))
 
         if current_size == "Custom":
             self.fill_inputs_from_object()
@@ -153,34 +473,22 @@ class SealTaskPanel:
             f"{SealsLocale.tr('ui.use_cases')}: {SealsLocale.tr(definition['use_key'])}"
         )
 
+        self.groove_group.setVisible(type_id == "oring")
+
         # Populate Size Combo
         self.size_combo.blockSignals(True)
-        self.size_combo.clear()
-        custom_label = SealsLocale.tr("ui.custom")
-        self.size_combo.addItem(custom_label, "Custom")
-        for size_key in sorted(definition["data"].keys(), key=SealsUtils.natural_sort_key):
-            self.size_combo.addItem(size_key, size_key)
+        self.size_filter.blockSignals(True)
+        self.size_filter.clear()
+        self.size_filter.blockSignals(False)
+        self.size_model.set_table(definition["data"], SealsLocale.tr("ui.custom"))
+        self.size_proxy.set_filter_text("")
+        self.size_combo.setCurrentIndex(0)
         self.size_combo.blockSignals(False)
 
-        # Rebuild Dimension Fields
-        while self.inputs_layout.count():
-            item = self.inputs_layout.takeAt(0)
-            if item:
-                w = item.widget()
-                if w:
-                    w.setParent(None)
-        self.dimension_inputs = {}
-
-        validator = QtGui.QDoubleValidator(0.0, 10000.0, 3)
-        for prop in definition["properties"]:
-            short_label = SealsLocale.tr(prop["short_key"])
-            label_widget = QtGui.QLabel(f"{short_label}:")
-            le = QtGui.QLineEdit()
-            le.setValidator(validator)
-            le.setToolTip(SealsLocale.tr(prop["tooltip_key"]))
-            le.textChanged.connect(self.on_input_changed)
-            self.inputs_layout.addRow(label_widget, le)
-            self.dimension_inputs[prop["name"]] = le
+        # Swap in the cached parameter form of this type
+        widget, self.dimension_inputs = self.param_form(type_id)
+        self.params_stack.setCurrentWidget(widget)
+        self.live_preview.schedule()
 
         self.update_preview_image(definition)
         self.ignore_changes = False
@@ -190,13 +498,10 @@ class SealTaskPanel:
 
     def update_preview_image(self, definition):
         image_name = definition.get("helper") or definition.get("icon")
-        path = SealsUtils.get_icon(image_name)
-        if os.path.exists(path):
-            pixmap = QtGui.QPixmap(path)
-            scaled_pixmap = pixmap.scaled(
-                320, 320, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
-            )
-            self.preview_image.setPixmap(scaled_pixmap)
+        dpr = getattr(self.preview_image, "devicePixelRatioF", lambda: 1.0)()
+        pixmap = preview_pixmap(image_name, PREVIEW_SIZE, dpr)
+        if pixmap is not None:
+            self.preview_image.setPixmap(pixmap)
         else:
             self.preview_image.setText(SealsLocale.tr("ui.no_preview"))
 
@@ -219,9 +524,44 @@ class SealTaskPanel:
                     self.dimension_inputs[prop["name"]].setText(str(data[i]))
             self.ignore_changes = False
 
+    def on_nearest_size(self):
+        """Select the standard size closest to the dimensions entered so far."""
+        type_id = self._current_type_id()
+        dims = {}
+        for name, le in self.dimension_inputs.items():
+            txt = le.text().strip().replace(",", ".")
+            try:
+                dims[name] = float(txt)
+            except ValueError:
+                continue
+        if not dims:
+            return
+        matches = self.maker.find_nearest_sizes(type_id, 1, **dims)
+        if matches:
+            self.select_size(matches[0][0])
+
+    def select_size(self, size_key):
+        """Make size_key the current size, clearing the filter if it hides it."""
+        idx = self.size_combo.findData(size_key)
+        if idx < 0 and self.size_filter.text():
+            self.size_filter.clear()
+            idx = self.size_combo.findData(size_key)
+        if idx >= 0:
+            self.size_combo.setCurrentIndex(idx)
+        return idx >= 0
+
     def on_size_filter(self, text):
-        # rely on editable combo built-in behavior for filtering
-        pass
+        current = self.size_combo.currentData()
+        self.size_combo.blockSignals(True)
+        self.size_proxy.set_filter_text(text)
+        idx = self.size_combo.findData(current) if current else -1
+        self.size_combo.setCurrentIndex(max(idx, 0))
+        self.size_combo.blockSignals(False)
+        if text.strip() and (idx <= 0 or current == "Custom") and self.size_combo.count() > 1:
+            # Pick the first match while typing
+            self.size_combo.setCurrentIndex(1)
+        elif idx < 0:
+            self.on_size_selected()
 
     def on_input_changed(self):
         if self.ignore_changes:
@@ -247,6 +587,14 @@ class SealTaskPanel:
                 self.dimension_inputs[prop["name"]].setText(text)
         self.ignore_changes = False
 
+    def _input_value(self, name):
+        """Numeric value (mm) of a dimension input, 0 if empty or invalid."""
+        txt = self.dimension_inputs[name].text().strip().replace(",", ".")
+        try:
+            return float(txt) if txt else 0.0
+        except ValueError:
+            return 0.0
+
     def accept(self):
         type_id = self._current_type_id()
         definition = self.maker.get_definition(type_id)
@@ -264,35 +612,44 @@ class SealTaskPanel:
             SealsBase.SealsObject(obj, type_id)
             SealsBase.ViewProvider(obj.ViewObject)
 
-        doc.openTransaction("Edit Seal")
-        obj.StandardSize = size_key
-        for prop in definition["properties"]:
-            le = self.dimension_inputs[prop["name"]]
-            txt = le.text().strip()
-            if not txt:
-                txt = "0"
-            setattr(obj, prop["name"], txt + " mm")
-
-        doc.commitTransaction()
-        doc.recompute()
+        dims = [self._input_value(prop["name"]) for prop in definition["properties"]]
+        obj.Proxy.apply_dimensions(obj, dims, size_key, transaction="Edit Seal")
         self.reject()
 
+    def preview_request(self):
+        """(type_id, dims, placement) for the live preview, None if nothing to show."""
+        type_id = self._current_type_id()
+        definition = self.maker.get_definition(type_id)
+        dims = []
+        for prop in definition["properties"]:
+            le = self.dimension_inputs.get(prop["name"])
+            txt = le.text().strip().replace(",", ".") if le else ""
+            try:
+                dims.append(float(txt))
+            except ValueError:
+                return None
+        if self.maker.section_bounds(type_id, dims) is None:
+            return None
+        placement = FreeCAD.Placement()
+        if self.edit_object:
+            current = [
+                getattr(getattr(self.edit_object, p["name"]), "Value", None)
+                for p in definition["properties"]
+            ]
+            if current == dims:
+                return None  # The object itself already shows these dimensions
+            placement = self.edit_object.getGlobalPlacement()
+        return type_id, dims, placement
+
     def reject(self):
         global panel
+        self.live_preview.stop()
+        self.release_forms()
         FreeCADGui.Control.closeDialog()
         panel = None
+        # Task dialogs delete their form when closed, prepare the next one
+        schedule_prewarm()
 
     def getStandardButtons(self):
         return 0
 
-
-# --- Observer ---
-class SelectionObserver:
-    def addSelection(self, doc, obj, sub, pos):
-        pass
-
-    def removeSelection(self, doc, obj, sub):
-        pass
-
-    def clearSelection(self, doc):
-        pass
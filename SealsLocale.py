@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 """
 Lightweight localization utilities for SealsWorkbench.
-Supports English and German with an automatic fallback to English.
+Supports English and German with an automatic fallback to English. Further
+languages are read on demand from <code>.json files in SealsData/locale or
+<UserAppData>/SealsWorkbench/locale, each holding a flat {key: text} object.
+
+The active language is resolved once and each language's catalog is merged
+with English into one dict, so tr() is a single lookup. Both are reset when
+FreeCAD's language preference changes.
 """
+import os
+import json
 import FreeCAD
 import locale
 
+GENERAL_PARAMS = "User parameter:BaseApp/Preferences/General"
+LOCALE_DIR = os.path.join(os.path.dirname(__file__), "SealsData", "locale")
+
 # Stable language codes we support
 SUPPORTED_LANGS = {"en", "de"}
 
@@ -21,6 +32,14 @@ LANG_ALIASES = {
     "en-gb": "en",
     "en_us": "en",
     "en-us": "en",
+    "french": "fr",
+    "italian": "it",
+    "spanish": "es",
+    "polish": "pl",
+    "czech": "cs",
+    "dutch": "nl",
+    "portuguese": "pt",
+    "russian": "ru",
 }
 
 # Basic translation catalog. Keys are plain identifiers so we can reuse them in
@@ -43,6 +62,18 @@ TRANSLATIONS = {
         "cmd.tt.create_usit": "Create a bonded seal (Usit-Ring)",
         "cmd.tt.change_params": "Edit the selected seal object",
         "cmd.tt.duplicate": "Duplicate the selected seal",
+        "cmd.link_seal": "Link Seal",
+        "cmd.tt.link_seal": "Create a lightweight link that shares the shape of the selected seal",
+        "cmd.link_array": "Link Seal Array",
+        "cmd.tt.link_array": "Create an array of links that share the shape of the selected seal",
+        "ui.array_count": "Number of instances:",
+        "cmd.detail_level": "Seal Detail Level",
+        "cmd.tt.detail_level": "Choose how detailed the seals of the active document are shown",
+        "ui.detail_level": "Detail level:",
+        "cmd.clear_cache": "Clear Seal Shape Cache",
+        "cmd.tt.clear_cache": "Delete all cached seal shapes from memory and disk",
+        "cmd.startup_timing": "Startup Timing",
+        "cmd.tt.startup_timing": "Print how long workbench activation, the first command and the first seal took",
         "ui.type": "Seal Type",
         "ui.standard_size": "Standard Size",
         "ui.standard_size.tip": "Choose a standard size or switch to Custom to enter your own dimensions.",
@@ -91,6 +122,37 @@ TRANSLATIONS = {
         "prop.standard_size.tip": "Select a standard size from the norm table or choose Custom to input values.",
         "obj.seal_type.desc": "Type of the seal",
         "obj.standard_size.desc": "Standard size selection",
+        "obj.density.desc": "Material density used for the mass",
+        "obj.volume.desc": "Volume of the seal (computed)",
+        "obj.area.desc": "Surface area of the seal (computed)",
+        "obj.mass.desc": "Mass of the seal from volume and density (computed)",
+        "obj.fingerprint.desc": "Type and dimensions of the current shape (internal)",
+        "obj.detail_level.desc": "Full profile, simplified Envelope or bounding-ring Proxy; Document follows the document setting",
+        "ui.size_filter": "Filter sizes",
+        "ui.size_filter.tip": "Type part of a size, e.g. 20x or x7, to narrow the list",
+        "ui.size_source": "Source: {}",
+        "ui.nearest_size": "Nearest",
+        "ui.nearest_size.tip": "Select the standard size closest to the dimensions entered below",
+        "ui.groove": "Groove Calculator",
+        "ui.groove.housing": "Housing",
+        "ui.groove.piston": "Radial, piston (groove on inner part)",
+        "ui.groove.rod": "Radial, rod (groove in bore)",
+        "ui.groove.axial": "Axial (face groove)",
+        "ui.groove.service": "Service",
+        "ui.groove.static": "Static",
+        "ui.groove.dynamic": "Dynamic",
+        "ui.groove.mating_diameter": "Bore / rod Ø",
+        "ui.groove.mating_diameter.tip": "Bore diameter (piston) or rod diameter (rod); not needed for axial grooves",
+        "ui.groove.groove_diameter": "Groove Ø",
+        "ui.groove.groove_diameter.tip": "Groove bottom diameter (radial) or outer groove diameter (axial)",
+        "ui.groove.width": "Groove width",
+        "ui.groove.width.tip": "Axial width of a radial groove, radial width of a face groove",
+        "ui.groove.depth": "Groove depth",
+        "ui.groove.depth.tip": "Gland depth; derived from the diameters for radial grooves if empty",
+        "ui.groove.search": "Find O-Rings",
+        "ui.groove.none": "No O-ring of the table fits this groove",
+        "ui.groove.invalid": "Enter positive groove dimensions",
+        "ui.groove.result": "{name}: squeeze {squeeze:.1f} %, fill {fill:.0f} %, stretch {stretch:.1f} %",
         "ui.editing": "Editing seal",
         "ui.creating": "Create new seal",
     },
@@ -111,6 +173,18 @@ TRANSLATIONS = {
         "cmd.tt.create_usit": "Erstellt einen Usit-/Bonded-Dichtring",
         "cmd.tt.change_params": "Ausgewählte Dichtung bearbeiten",
         "cmd.tt.duplicate": "Ausgewählte Dichtung duplizieren",
+        "cmd.link_seal": "Dichtung verknüpfen",
+        "cmd.tt.link_seal": "Erstellt eine leichtgewichtige Verknüpfung, die die Form der ausgewählten Dichtung teilt",
+        "cmd.link_array": "Verknüpfungs-Array",
+        "cmd.tt.link_array": "Erstellt ein Array aus Verknüpfungen, die die Form der ausgewählten Dichtung teilen",
+        "ui.array_count": "Anzahl der Instanzen:",
+        "cmd.detail_level": "Detailgrad der Dichtungen",
+        "cmd.tt.detail_level": "Legt fest, wie detailliert die Dichtungen des aktiven Dokuments dargestellt werden",
+        "ui.detail_level": "Detailgrad:",
+        "cmd.clear_cache": "Dichtungs-Formcache leeren",
+        "cmd.tt.clear_cache": "Alle zwischengespeicherten Dichtungsformen aus Speicher und Festplatte löschen",
+        "cmd.startup_timing": "Startzeiten",
+        "cmd.tt.startup_timing": "Ausgeben, wie lange Aktivierung der Workbench, erster Befehl und erste Dichtung gedauert haben",
         "ui.type": "Dichtungstyp",
         "ui.standard_size": "Normgröße",
         "ui.standard_size.tip": "Normgröße wählen oder auf Benutzerdefiniert umschalten, um eigene Maße einzugeben.",
@@ -159,6 +233,37 @@ TRANSLATIONS = {
         "prop.standard_size.tip": "Normgröße aus der Tabelle wählen oder Benutzerdefiniert, um Werte einzugeben.",
         "obj.seal_type.desc": "Dichtungstyp",
         "obj.standard_size.desc": "Auswahl der Normgröße",
+        "obj.density.desc": "Materialdichte für die Masseberechnung",
+        "obj.volume.desc": "Volumen der Dichtung (berechnet)",
+        "obj.area.desc": "Oberfläche der Dichtung (berechnet)",
+        "obj.mass.desc": "Masse der Dichtung aus Volumen und Dichte (berechnet)",
+        "obj.fingerprint.desc": "Typ und Abmessungen der aktuellen Form (intern)",
+        "obj.detail_level.desc": "Volles Profil, vereinfachte Hülle (Envelope) oder Hüllring (Proxy); Document folgt der Dokumenteinstellung",
+        "ui.size_filter": "Größen filtern",
+        "ui.size_filter.tip": "Teil einer Größe eingeben, z. B. 20x oder x7, um die Liste einzugrenzen",
+        "ui.size_source": "Quelle: {}",
+        "ui.nearest_size": "Nächste",
+        "ui.nearest_size.tip": "Die Normgröße wählen, die den unten eingegebenen Maßen am nächsten kommt",
+        "ui.groove": "Nutrechner",
+        "ui.groove.housing": "Einbauraum",
+        "ui.groove.piston": "Radial, Kolben (Nut im Innenteil)",
+        "ui.groove.rod": "Radial, Stange (Nut in der Bohrung)",
+        "ui.groove.axial": "Axial (Stirnnut)",
+        "ui.groove.service": "Anwendung",
+        "ui.groove.static": "Statisch",
+        "ui.groove.dynamic": "Dynamisch",
+        "ui.groove.mating_diameter": "Bohrungs- / Stangen-Ø",
+        "ui.groove.mating_diameter.tip": "Bohrungsdurchmesser (Kolben) oder Stangendurchmesser (Stange); bei Axialnuten nicht nötig",
+        "ui.groove.groove_diameter": "Nut-Ø",
+        "ui.groove.groove_diameter.tip": "Nutgrunddurchmesser (radial) oder Nutaußendurchmesser (axial)",
+        "ui.groove.width": "Nutbreite",
+        "ui.groove.width.tip": "Axiale Breite einer Radialnut, radiale Breite einer Stirnnut",
+        "ui.groove.depth": "Nuttiefe",
+        "ui.groove.depth.tip": "Nuttiefe; bei Radialnuten aus den Durchmessern berechnet, wenn leer",
+        "ui.groove.search": "O-Ringe suchen",
+        "ui.groove.none": "Kein O-Ring der Tabelle passt in diese Nut",
+        "ui.groove.invalid": "Positive Nutmaße eingeben",
+        "ui.groove.result": "{name}: Verpressung {squeeze:.1f} %, Füllgrad {fill:.0f} %, Dehnung {stretch:.1f} %",
         "ui.editing": "Dichtung bearbeiten",
         "ui.creating": "Neue Dichtung erstellen",
     },
@@ -181,7 +286,7 @@ def _normalize_lang(raw_value):
 def _detect_language():
     """Return a short language code like 'en' or 'de' with fallback to 'en'."""
     try:
-        params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/General")
+        params = FreeCAD.ParamGet(GENERAL_PARAMS)
         raw_lang = params.GetString("Language", "") or params.GetString("locale", "")
     except Exception:
         raw_lang = ""
@@ -199,18 +304,120 @@ def _detect_language():
         return "de"
     if lang.startswith("en") or "english" in lang:
         return "en"
-    if len(lang) == 2 and lang in SUPPORTED_LANGS:
-        return lang
+    code = lang.split("_", 1)[0]
+    if len(code) == 2 and (code in SUPPORTED_LANGS or _locale_file(code)):
+        return code
     return "en"
 
 
+# --- Cached catalogs ------------------------------------------------------------
+_language = None  # resolved language code
+_catalog = None  # TRANSLATIONS[_language] merged over English
+_observer = None
+_loaded_files = set()  # languages whose catalog file was read
+
+
+class _LanguageObserver:
+    """Parameter observer that drops the cached language when it changes."""
+
+    def OnChange(self, group, name):
+        if name in ("Language", "locale"):
+            invalidate()
+
+
+def _locale_file(lang):
+    """Path of the catalog file of lang, or None."""
+    dirs = [LOCALE_DIR]
+    try:
+        dirs.append(os.path.join(FreeCAD.getUserAppDataDir(), "SealsWorkbench", "locale"))
+    except Exception:
+        pass
+    for directory in reversed(dirs):
+        path = os.path.join(directory, f"{lang}.json")
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _load_language(lang):
+    """
+    Read the catalog file of lang once per session. Its entries take
+    precedence over the built-in ones and those of seal type declarations.
+    """
+    if lang in _loaded_files:
+        return
+    _loaded_files.add(lang)
+    path = _locale_file(lang)
+    if not path:
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            add_translations(lang, json.load(f), override=True)
+    except (OSError, ValueError) as e:
+        FreeCAD.Console.PrintWarning(f"Could not read translations {path}: {e}\n")
+
+
+def active_language():
+    """The language used by tr(), resolved on first use."""
+    global _language, _observer
+    if _language is None:
+        _language = _detect_language()
+        if _observer is None:
+            try:
+                _observer = _LanguageObserver()
+                FreeCAD.ParamGet(GENERAL_PARAMS).Attach(_observer)
+            except Exception:
+                pass
+    return _language
+
+
+def _active_catalog():
+    global _catalog
+    if _catalog is None:
+        lang = active_language()
+        _load_language(lang)
+        catalog = dict(TRANSLATIONS["en"])
+        catalog.update(TRANSLATIONS.get(lang, {}))
+        _catalog = catalog
+    return _catalog
+
+
+def invalidate():
+    """Forget the resolved language and flattened catalog."""
+    global _language, _catalog
+    _language = None
+    _catalog = None
+
+
 def tr(key):
     """Translate a key using the active FreeCAD language, fallback to English."""
-    lang = _detect_language()
-    return TRANSLATIONS.get(lang, {}).get(key, TRANSLATIONS["en"].get(key, key))
+    catalog = _catalog
+    if catalog is None:
+        catalog = _active_catalog()
+    return catalog.get(key, key)
 
 
 def tr_short(key, default=None):
     """Short version helper that allows a custom default."""
-    lang = _detect_language()
-    return TRANSLATIONS.get(lang, {}).get(key, default or TRANSLATIONS["en"].get(key, key))
+    if _catalog is None:
+        _active_catalog()
+    value = TRANSLATIONS.get(_language, {}).get(key)
+    if value is None:
+        return default or TRANSLATIONS["en"].get(key, key)
+    return value
+
+
+def add_translations(lang, entries, override=False):
+    """
+    Register extra catalog entries (e.g. from seal type declarations).
+    Existing entries are kept unless override is set.
+    """
+    global _catalog
+    catalog = TRANSLATIONS.setdefault(lang, {})
+    if override:
+        catalog.update(entries)
+    else:
+        for key, value in entries.items():
+            catalog.setdefault(key, value)
+    SUPPORTED_LANGS.add(lang)
+    _catalog = None
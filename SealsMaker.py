@@ -1,168 +1,198 @@
 # -*- coding: utf-8 -*-
+import os
+import sys
+import hashlib
+from collections import namedtuple
+import functools
 import FreeCAD
 import Part
 import SealsUtils
 import SealsLocale
+import SealsCache
+import SealsProfiles
+import SealsTiming
+
+# --- Profile helpers ----------------------------------------------------------
+# Seal profiles are declared in SealsData/profiles and compiled by
+# SealsProfiles. These wrappers keep the per-type batch evaluators available.
+def shaft_seal_profiles(dims):
+    """(N, P, 2) DIN 3760 outlines for one or more (d1, d2, b) rows."""
+    return SealsProfiles.get_profile("shaft_seal").evaluate(dims)
+
+
+def vring_profiles(dims):
+    """(N, P, 2) V-Ring Type A outlines for one or more (d1, A, C) rows."""
+    return SealsProfiles.get_profile("vring").evaluate(dims)
+
+
+def usit_profiles(dims):
+    """(N, P, 2) Usit-ring outlines for one or more (d1, d2, s, h) rows."""
+    return SealsProfiles.get_profile("usit").evaluate(dims)
+
+
+class _Definition(dict):
+    """Seal type definition whose size table is read on first access of "data"."""
+
+    def __missing__(self, key):
+        if key != "data":
+            raise KeyError(key)
+        with SealsTiming.measure(f"table.{self['type_id']}"):
+            data = self["data"] = SealsUtils.load_catalog(self["type_id"], self["data_file"])
+        return data
+
+
+# Levels of detail understood by SealsMakerClass.make_shape:
+#   Full     - the detailed seal profile
+#   Envelope - a rectangular (O-ring: circular) section with the same extents
+#   Proxy    - circular edges outlining the bounding ring, no faces
+DETAIL_LEVELS = ["Full", "Envelope", "Proxy"]
+
+# Result of SealsMakerClass.make_many for one input row. shape is None and
+# error holds a message when generation failed.
+BatchResult = namedtuple("BatchResult", ["index", "dims", "shape", "error"])
+
+
+def _generate_brep(job):
+    """Worker entry point: build one seal and return it as a BREP string."""
+    type_id, dims, optimized = job
+    try:
+        maker = get_instance()
+        # The parent checked the disk cache already and stores the results
+        maker.disk_cache = None
+        shape = maker.make_shape(type_id, dims, optimized=optimized)
+        if shape.isNull():
+            return None, f"Invalid dimensions for {type_id}: {tuple(dims)}"
+        return shape.exportBrepToString(), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _hash_code(code, digest, seen):
+    """
+    Feed a code object into digest, following the module level functions it
+    references so that changes to the geometry code alter the hash.
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(const, digest, seen)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+    module_globals = sys.modules[__name__].__dict__
+    for name in code.co_names:
+        if name in seen:
+            continue
+        seen.add(name)
+        value = module_globals.get(name)
+        if hasattr(value, "__code__"):
+            _hash_code(value.__code__, digest, seen)
+
+
+def solid_from_section(section, optimized=False):
+    """
+    Geometry backend: revolve a SealsProfiles.Section 360 degrees around the
+    Z axis into an OCC solid. Points listed in arc_mids are midpoints of
+    three-point arcs. See SealsMakerClass.make_from_profile for optimized.
+    """
+    if section.kind == "circle":
+        x, z = section.center
+        return Part.makeTorus(x, section.radius, FreeCAD.Vector(0, 0, z))
+    profile, arc_mids = section.points, section.arc_mids
+    if optimized:
+        profile, arc_mids = SealsProfiles.merge_collinear(profile, arc_mids)
+    points = [FreeCAD.Vector(x, 0, z) for x, z in profile.tolist()]
+    if arc_mids:
+        edges = []
+        i = 0
+        while i < len(points) - 1:
+            if i + 1 in arc_mids:
+                edges.append(Part.Arc(points[i], points[i + 1], points[i + 2]).toShape())
+                i += 2
+            else:
+                edges.append(Part.LineSegment(points[i], points[i + 1]).toShape())
+                i += 1
+        wire = Part.Wire(edges)
+    else:
+        wire = Part.makePolygon(points)
+    face = Part.Face(wire)
+    solid = face.revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360)
+    if optimized:
+        refined = solid.removeSplitter()
+        if refined.isValid() and refined.Solids:
+            solid = refined.Solids[0]
+    return solid
+
+
+def shape_from_brep(brep):
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    return shape
+
 
 class SealsMakerClass:
     """
     The engine that generates seal geometry.
-    Singleton pattern accessible via 'Instance'.
+    Singleton accessible via 'Instance', created on first access.
     """
 
     def __init__(self):
-        self.oring_data = SealsUtils.load_csv_data("din_3771.csv")
-        self.shaft_seal_data = SealsUtils.load_csv_data("din_3760.csv")
-        self.vring_data = SealsUtils.load_csv_data("vring_type_a.csv")
-        self.usit_data = SealsUtils.load_csv_data("usit_ring.csv")
-
-        # Stable IDs for definitions
-        self.definitions = {
-            "oring": {
-                "object_name": "ORing",
-                "data": self.oring_data,
-                "generator": self.makeORing,
-                "label_key": "type.oring.name",
-                "desc_key": "type.oring.desc",
-                "use_key": "type.oring.use",
-                "icon": "icon_oring.svg",
-                "helper": "helper_oring.svg",
-                "properties": [
-                    {
-                        "name": "InnerDiameter",
-                        "type": "Length",
-                        "label_key": "prop.inner_diameter.name",
-                        "short_key": "prop.inner_diameter.short",
-                        "tooltip_key": "prop.inner_diameter.tip",
-                    },
-                    {
-                        "name": "CordDiameter",
-                        "type": "Length",
-                        "label_key": "prop.cord_diameter.name",
-                        "short_key": "prop.cord_diameter.short",
-                        "tooltip_key": "prop.cord_diameter.tip",
-                    },
-                ],
-                "defaults": ["10 mm", "2 mm"],
-            },
-            "shaft_seal": {
-                "object_name": "ShaftSeal",
-                "data": self.shaft_seal_data,
-                "generator": self.makeShaftSeal,
-                "label_key": "type.shaft.name",
-                "desc_key": "type.shaft.desc",
-                "use_key": "type.shaft.use",
-                "icon": "icon_shaft_seal.svg",
-                "helper": "helper_shaft_seal.svg",
-                "properties": [
-                    {
-                        "name": "InnerDiameter",
-                        "type": "Length",
-                        "label_key": "prop.inner_diameter.name",
-                        "short_key": "prop.inner_diameter.short",
-                        "tooltip_key": "prop.inner_diameter.tip",
-                    },
-                    {
-                        "name": "OuterDiameter",
-                        "type": "Length",
-                        "label_key": "prop.outer_diameter.name",
-                        "short_key": "prop.outer_diameter.short",
-                        "tooltip_key": "prop.outer_diameter.tip",
-                    },
-                    {
-                        "name": "Width",
-                        "type": "Length",
-                        "label_key": "prop.width.name",
-                        "short_key": "prop.width.short",
-                        "tooltip_key": "prop.width.tip",
-                    },
-                ],
-                "defaults": ["20 mm", "40 mm", "7 mm"],
-            },
-            "vring": {
-                "object_name": "VRing",
-                "data": self.vring_data,
-                "generator": self.makeVRing,
-                "label_key": "type.vring.name",
-                "desc_key": "type.vring.desc",
-                "use_key": "type.vring.use",
-                "icon": "icon_vring.svg",
-                "helper": "helper_vring.svg",
-                "properties": [
-                    {
-                        "name": "ShaftDiameter",
-                        "type": "Length",
-                        "label_key": "prop.inner_diameter.name",
-                        "short_key": "prop.inner_diameter.short",
-                        "tooltip_key": "prop.inner_diameter.tip",
-                    },
-                    {
-                        "name": "SectionWidth",
-                        "type": "Length",
-                        "label_key": "prop.section_width.name",
-                        "short_key": "prop.section_width.short",
-                        "tooltip_key": "prop.section_width.tip",
-                    },
-                    {
-                        "name": "SectionHeight",
-                        "type": "Length",
-                        "label_key": "prop.section_height.name",
-                        "short_key": "prop.section_height.short",
-                        "tooltip_key": "prop.section_height.tip",
-                    },
-                ],
-                "defaults": ["20 mm", "5 mm", "6 mm"],
-            },
-            "usit": {
-                "object_name": "UsitRing",
-                "data": self.usit_data,
-                "generator": self.makeUsitRing,
-                "label_key": "type.usit.name",
-                "desc_key": "type.usit.desc",
-                "use_key": "type.usit.use",
-                "icon": "icon_usit_ring.svg",
-                "helper": "helper_usit_ring.svg",
-                "properties": [
-                    {
-                        "name": "InnerDiameter",
-                        "type": "Length",
-                        "label_key": "prop.inner_diameter.name",
-                        "short_key": "prop.inner_diameter.short",
-                        "tooltip_key": "prop.inner_diameter.tip",
-                    },
-                    {
-                        "name": "OuterDiameter",
-                        "type": "Length",
-                        "label_key": "prop.outer_diameter.name",
-                        "short_key": "prop.outer_diameter.short",
-                        "tooltip_key": "prop.outer_diameter.tip",
-                    },
-                    {
-                        "name": "Thickness",
-                        "type": "Length",
-                        "label_key": "prop.thickness.name",
-                        "short_key": "prop.thickness.short",
-                        "tooltip_key": "prop.thickness.tip",
-                    },
-                    {
-                        "name": "LipHeight",
-                        "type": "Length",
-                        "label_key": "prop.lip_height.name",
-                        "short_key": "prop.lip_height.short",
-                        "tooltip_key": "prop.lip_height.tip",
-                    },
-                ],
-                "defaults": ["10 mm", "16 mm", "1.5 mm", "2 mm"],
-            },
-        }
+        params = SealsUtils.get_params()
+        # Dimensions closer than this (mm) share a cache entry
+        self.cache_tolerance = params.GetFloat("ShapeCacheTolerance", 1e-6) or 1e-6
+        self.shape_cache = SealsCache.ShapeCache(params.GetInt("ShapeCacheSize", 256))
+        self.disk_cache = None
+        if params.GetBool("DiskCacheEnabled", True):
+            self.disk_cache = SealsCache.DiskShapeCache(
+                SealsCache.default_cache_dir("shapes"),
+                params.GetInt("DiskCacheSizeMB", 256) * 1024 * 1024,
+            )
+        self._profile_signatures = {}
+        # Build solids with merged faces, see make_from_profile
+        self.optimize_topology = params.GetBool("OptimizeTopology", False)
 
+        SealsProfiles.set_search_dirs(
+            [os.path.join(FreeCAD.getUserAppDataDir(), "SealsWorkbench", "types")]
+        )
+        # Stable IDs for definitions, in declaration order
+        self.definitions = {}
         # Legacy label to ID mapping for compatibility
-        self.legacy_names = {
-            "O-Ring (DIN 3771)": "oring",
-            "Shaft Seal (DIN 3760)": "shaft_seal",
-            "V-Ring (Type A)": "vring",
-            "Usit-Ring (Bonded Seal)": "usit",
-        }
+        self.legacy_names = {}
+        for type_id, entry in SealsProfiles.load_types().items():
+            self.definitions[type_id] = self._make_definition(type_id, entry)
+            if entry.get("legacy_name"):
+                self.legacy_names[entry["legacy_name"]] = type_id
+
+    def _make_definition(self, type_id, entry):
+        """Turn a declared seal type into the definition dict used by the UI."""
+        base_dir = entry["base_dir"]
+        for lang, entries in entry.get("translations", {}).items():
+            SealsLocale.add_translations(lang, entries)
+        definition = _Definition(
+            type_id=type_id,
+            object_name=entry.get("object_name", "Seal"),
+            generator=functools.partial(self.make_from_profile, type_id),
+            data_file=os.path.join(base_dir, entry["data"]) if entry.get("data") else "",
+            label_key=entry.get("label_key", type_id),
+            desc_key=entry.get("desc_key", ""),
+            use_key=entry.get("use_key", ""),
+            properties=entry["properties"],
+            defaults=entry.get("defaults", []),
+            density=entry.get("density", 1200),
+        )
+        for key in ("icon", "helper"):
+            name = entry.get(key)
+            if name and os.path.exists(os.path.join(base_dir, name)):
+                # Icons shipped next to a user type declaration
+                name = os.path.join(base_dir, name)
+            definition[key] = name or "icon_workbench.svg"
+        return definition
+
+    # Size tables of the built-in types, read on first access
+    oring_data = property(lambda self: self.definitions["oring"]["data"])
+    shaft_seal_data = property(lambda self: self.definitions["shaft_seal"]["data"])
+    vring_data = property(lambda self: self.definitions["vring"]["data"])
+    usit_data = property(lambda self: self.definitions["usit"]["data"])
 
     # --- Helpers ----------------------------------------------------------------
     def get_definition(self, type_id):
@@ -176,178 +206,335 @@ class SealsMakerClass:
     def all_definitions(self):
         return self.definitions.items()
 
+    def reload_catalogs(self):
+        """Forget the loaded size tables, e.g. after catalog files were added."""
+        for definition in self.definitions.values():
+            definition.pop("data", None)
+
+    # --- Shape cache ------------------------------------------------------------
+    def cache_key(self, type_id, dims, detail="Full", optimized=False):
+        """Return a hashable key for type_id and dims, quantized to cache_tolerance."""
+        tol = self.cache_tolerance
+        optimized = bool(optimized) and detail == "Full"
+        return (type_id, detail, tuple(int(round(float(d) / tol)) for d in dims), optimized)
+
+    def make_shape(self, type_id, dims, detail="Full", optimized=None):
+        """
+        Return the shape for type_id and dims, served from the shape cache when
+        an equivalent seal was generated before. detail is one of DETAIL_LEVELS.
+        optimized selects the low face count build and defaults to the
+        OptimizeTopology preference.
+        """
+        if optimized is None:
+            optimized = self.optimize_topology
+        definition = self.get_definition(type_id)
+        if not definition:
+            raise ValueError(f"Unknown seal type: {type_id}")
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Unknown detail level: {detail}")
+        key = self.cache_key(type_id, dims, detail, optimized)
+        shape = self.shape_cache.get(key)
+        if shape is not None:
+            return shape
+        digest = None
+        if self.disk_cache and detail == "Full":
+            # Simplified shapes are cheaper to build than to read back
+            digest = self._disk_digest(type_id, key)
+            shape = self.disk_cache.get(digest)
+        if shape is None:
+            if detail == "Envelope":
+                shape = self.makeEnvelope(type_id, dims)
+            elif detail == "Proxy":
+                shape = self.makeProxy(type_id, dims)
+            else:
+                shape = definition["generator"](*dims, optimized=key[3])
+            if digest:
+                self.disk_cache.put(digest, shape)
+        self.shape_cache.put(key, shape)
+        return SealsCache.copy_shape(shape) if not shape.isNull() else shape
+
+    def _disk_digest(self, type_id, key):
+        """Name of the DiskShapeCache entry of a cache key."""
+        return SealsCache.DiskShapeCache.digest(self.profile_signature(type_id), key)
+
+    def profile_signature(self, type_id):
+        """
+        Hash of the profile declaration and solid builder of a seal type. Used to
+        key the disk cache so that entries expire when a profile changes.
+        """
+        signature = self._profile_signatures.get(type_id)
+        if signature is None:
+            digest = hashlib.sha1(type_id.encode("utf-8"))
+            digest.update(SealsProfiles.get_profile(type_id).signature.encode("utf-8"))
+            _hash_code(SealsMakerClass.make_from_profile.__code__, digest, set())
+            _hash_code(solid_from_section.__code__, digest, set())
+            _hash_code(SealsProfiles.merge_collinear.__code__, digest, set())
+            signature = self._profile_signatures[type_id] = digest.hexdigest()
+        return signature
+
+    def configure_cache(self, max_entries=None, tolerance=None):
+        """Change the shape cache limits and store them in the preferences."""
+        params = SealsUtils.get_params()
+        if max_entries is not None:
+            self.shape_cache.resize(max_entries)
+            params.SetInt("ShapeCacheSize", self.shape_cache.max_entries)
+        if tolerance is not None and tolerance > 0:
+            self.cache_tolerance = float(tolerance)
+            self.shape_cache.clear()
+            params.SetFloat("ShapeCacheTolerance", self.cache_tolerance)
+
+    def make_many(self, type_id, dims_list, workers=None, optimized=None):
+        """
+        Generate shapes for every entry of dims_list.
+        Work is spread over a pool of headless FreeCAD worker processes and
+        returned as BREP strings; workers=1 builds everything in this process.
+        Returns a list of BatchResult in input order. Cached and repeated
+        dimensions are generated at most once.
+        """
+        if not self.get_definition(type_id):
+            raise ValueError(f"Unknown seal type: {type_id}")
+        dims_list = [tuple(float(d) for d in dims) for dims in dims_list]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if optimized is None:
+            optimized = self.optimize_topology
+
+        # Shapes available now are copied right away, so that later
+        # evictions cannot send them back through make_shape
+        ready = {}
+        pending = {}
+        for dims in dims_list:
+            key = self.cache_key(type_id, dims, optimized=optimized)
+            if key in ready or key in pending:
+                continue
+            shape = self.shape_cache.get(key)
+            if shape is None and self.disk_cache:
+                shape = self.disk_cache.get(self._disk_digest(type_id, key))
+                if shape is not None:
+                    self.shape_cache.put(key, shape)
+            if shape is None:
+                pending[key] = dims
+            else:
+                ready[key] = shape
+
+        errors = {}
+        if pending:
+            jobs = [(type_id, dims, optimized) for dims in pending.values()]
+            if workers > 1 and len(jobs) > 1 and not SealsUtils.headless_python():
+                FreeCAD.Console.PrintMessage(
+                    "No headless FreeCAD interpreter found, generating seals in this process\n"
+                )
+                workers = 1
+            if workers <= 1 or len(jobs) == 1:
+                # make_shape fills both caches itself
+                for key, dims in pending.items():
+                    try:
+                        shape = self.make_shape(type_id, dims, optimized=optimized)
+                    except Exception as e:
+                        errors[key] = str(e)
+                        continue
+                    if shape.isNull():
+                        errors[key] = f"Invalid dimensions for {type_id}: {dims}"
+                    else:
+                        ready[key] = shape
+            else:
+                for key, (shape, error) in zip(pending, self._run_pool(jobs, workers)):
+                    if error:
+                        errors[key] = error
+                    else:
+                        self.shape_cache.put(key, shape)
+                        if self.disk_cache:
+                            self.disk_cache.put(self._disk_digest(type_id, key), shape)
+                        ready[key] = shape
+
+        results = []
+        for index, dims in enumerate(dims_list):
+            key = self.cache_key(type_id, dims, optimized=optimized)
+            if key in errors:
+                results.append(BatchResult(index, dims, None, errors[key]))
+            else:
+                results.append(BatchResult(index, dims, SealsCache.copy_shape(ready[key]), None))
+        return results
+
+    def _run_pool(self, jobs, workers):
+        """Run _generate_brep over jobs in worker processes, keeping job order."""
+        workers = min(workers, len(jobs))
+        chunksize = max(1, len(jobs) // (workers * 4))
+        outcomes = []
+        try:
+            with SealsUtils.create_process_pool(workers) as pool:
+                for brep, error in pool.map(_generate_brep, jobs, chunksize=chunksize):
+                    outcomes.append((shape_from_brep(brep) if brep else None, error))
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"Seal worker pool failed: {e}\n")
+            outcomes.extend((None, str(e)) for _ in range(len(jobs) - len(outcomes)))
+        return outcomes
+
+    def cache_stats(self):
+        return self.shape_cache.stats()
+
+    def clear_cache(self, disk=False):
+        """Empty the in-memory shape cache, and the disk cache if disk is True."""
+        self.shape_cache.clear()
+        if disk and self.disk_cache:
+            self.disk_cache.clear()
+
+    def disk_cache_stats(self):
+        return self.disk_cache.stats() if self.disk_cache else None
+
+    # --- Size lookup ------------------------------------------------------------
+    def _table_columns(self, type_id, values):
+        """Map property names (e.g. InnerDiameter) to the table's column names."""
+        definition = self.get_definition(type_id)
+        if not definition:
+            raise ValueError(f"Unknown seal type: {type_id}")
+        table = definition["data"]
+        names = {p["name"]: c for p, c in zip(definition["properties"], table.columns)}
+        return table, {names.get(k, k): v for k, v in values.items()}
+
+    def find_nearest_sizes(self, type_id, k=1, **dims):
+        """
+        Standard sizes closest to the given dimensions, as [(size_key,
+        distance), ...]. Dimensions are given by table column or property
+        name, e.g. find_nearest_sizes("shaft_seal", d1=23.4, d2=40).
+        """
+        table, target = self._table_columns(type_id, dims)
+        return table.nearest(k, **target)
+
+    def find_sizes_in_range(self, type_id, **bounds):
+        """
+        Standard sizes whose dimensions lie within (low, high) bounds, e.g.
+        find_sizes_in_range("oring", d1=(20, 30), d2=(None, 3)).
+        """
+        table, bounds = self._table_columns(type_id, bounds)
+        return table.in_range(**bounds)
+
+    def table_profiles(self, type_id):
+        """
+        Return (size_keys, sections) for every row of a type's size table,
+        sections being the batch result of the type's compiled profile.
+        """
+        definition = self.get_definition(type_id)
+        data = definition["data"]
+        count = len(definition["properties"])
+        keys = data.natural_order()
+        dims = [data[k][:count] for k in keys]
+        return keys, SealsProfiles.get_profile(type_id).evaluate(dims)
+
+    def shaft_seal_table_profiles(self):
+        return self.table_profiles("shaft_seal")
+
+    def mass_properties(self, type_id, dims, density=None):
+        """
+        Volume (mm^3), surface area (mm^2) and mass (kg) of a seal, computed
+        analytically from its profile. density in kg/m^3 defaults to the
+        type's nominal density.
+        """
+        import SealsMass
+
+        return SealsMass.mass_properties(type_id, dims, density)
+
+    def section(self, type_id, dims):
+        """The SealsProfiles.Section of a seal, or None for invalid dimensions."""
+        return SealsProfiles.section(type_id, tuple(dims))
+
+    def section_bounds(self, type_id, dims):
+        """
+        Return (r_min, r_max, z_min, z_max) of the seal cross-section, or None
+        for invalid dimensions.
+        """
+        section = self.section(type_id, dims)
+        return section.bounds if section else None
+
     # --- Geometry builders ------------------------------------------------------
     def makeORing(self, d1, d2):
-        if d1 <= 0 or d2 <= 0:
-            return Part.Shape()
-        major_radius = (d1 / 2.0) + (d2 / 2.0)
-        minor_radius = d2 / 2.0
-        return Part.makeTorus(major_radius, minor_radius)
+        return self.make_from_profile("oring", d1, d2)
 
     def makeShaftSeal(self, d1, d2, b):
-        if d1 <= 0 or d2 <= 0 or b <= 0 or d2 <= d1:
-            return Part.Shape()
+        return self.make_from_profile("shaft_seal", d1, d2, b)
 
-        r_shaft = d1 / 2.0
-        r_bore = d2 / 2.0
+    def makeVRing(self, d1, A, C):
+        # V-Ring Type A; d1 = shaft diameter, A = section width, C = section height
+        return self.make_from_profile("vring", d1, A, C)
 
-        # Original sketch bounding box for normalization
-        sketch_x_min = 11.6345
-        sketch_x_max = 184.5092
-        sketch_z_min = 15.1176 # The minimum Z-value from the sketch
-        sketch_z_max = 178.0259 # The maximum Z-value from the sketch
+    def makeUsitRing(self, d1, d2, s, h):
+        # Usit/bonded seal; s = metal thickness, h = rubber lip height
+        return self.make_from_profile("usit", d1, d2, s, h)
 
-        # Scaling factors
-        # Map sketch's radial range [sketch_x_min, sketch_x_max] to [r_shaft, r_bore]
-        x_scale_factor = (r_bore - r_shaft) / (sketch_x_max - sketch_x_min)
-        # Map sketch's axial range [sketch_z_min, sketch_z_max] to [0, b]
-        z_scale_factor = b / (sketch_z_max - sketch_z_min)
+    def make_from_profile(self, type_id, *dims, optimized=False):
+        """
+        Build the solid of any declared seal type from its profile.
+        With optimized, collinear outline segments are merged and faces on
+        the same plane, cylinder or cone are fused, which speeds up booleans
+        and export of the seal.
+        """
+        section = SealsProfiles.section(type_id, dims)
+        if section is None:
+            return Part.Shape()
+        return solid_from_section(section, optimized)
 
-        # Function to scale sketch coordinates to current parameters
-        def scale_point(x_sketch, z_sketch):
-            x_scaled = r_shaft + (x_sketch - sketch_x_min) * x_scale_factor
-            z_scaled = (z_sketch - sketch_z_min) * z_scale_factor
-            return FreeCAD.Vector(x_scaled, 0, z_scaled)
+    def topology_report(self, type_id, dims):
+        """
+        Face and edge counts of the regular and the optimized build, as
+        {"faces": (before, after), "edges": (before, after)}.
+        """
+        exact = self.make_from_profile(type_id, *dims)
+        optimized = self.make_from_profile(type_id, *dims, optimized=True)
+        return {
+            "faces": (len(exact.Faces), len(optimized.Faces)),
+            "edges": (len(exact.Edges), len(optimized.Edges)),
+        }
 
+    # --- Simplified geometry ----------------------------------------------------
+    def makeEnvelope(self, type_id, dims):
+        # Solid with the same bounding section as the full seal.
+        # Circular sections (O-rings) are already minimal and kept as they are.
+        if SealsProfiles.get_profile(type_id).kind == "circle":
+            return self.make_from_profile(type_id, *dims)
+        bounds = self.section_bounds(type_id, dims)
+        if not bounds:
+            return Part.Shape()
+        r_min, r_max, z_min, z_max = bounds
         points = [
-            scale_point(11.6345, 107.5580),
-            scale_point(11.6345, 16.3045),
-            scale_point(134.3197, 16.3045),
-            scale_point(142.4312, 31.0065),
-            scale_point(156.4028, 15.1176),
-            scale_point(166.8818, 20.8126),
-            scale_point(140.4033, 61.4243),
-            scale_point(184.5092, 143.0454),
-            scale_point(163.2166, 167.8866),
-            scale_point(117.5900, 167.8866),
-            # ArcOfCircle starts here, using start/end points as line segments
-            # End point of Arc: (117.5900, 153.1847)
-            scale_point(117.5900, 153.1847), 
-            # Start point of Arc: (130.9333, 100.9327)
-            scale_point(130.9333, 100.9327), 
-            scale_point(113.9683, 101.1421),
-            scale_point(113.9683, 68.5217),
-            scale_point(52.6986, 68.5217),
-            scale_point(39.5175, 101.4744),
-            scale_point(39.5175, 178.0259),
-            scale_point(16.7042, 178.0259),
-            scale_point(11.6345, 153.6917),
-            scale_point(11.6345, 107.5580) # Close the loop
+            FreeCAD.Vector(r_min, 0, z_min),
+            FreeCAD.Vector(r_max, 0, z_min),
+            FreeCAD.Vector(r_max, 0, z_max),
+            FreeCAD.Vector(r_min, 0, z_max),
+            FreeCAD.Vector(r_min, 0, z_min),
         ]
-
-        wire = Part.makePolygon(points)
-        face = Part.Face(wire)
+        face = Part.Face(Part.makePolygon(points))
         return face.revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360)
 
-    def makeVRing(self, d1, A, C):
-        # Generates a V-Ring Type A
-        # d1 = Shaft Diameter (Mounting ID)
-        # A = Section Width (Axial length of the body on shaft)
-        # C = Section Height (Radial height of the lip approx)
-        
-        if d1 <= 0 or A <= 0 or C <= 0:
+    def makeProxy(self, type_id, dims):
+        # Inner and outer circles at both axial ends of the bounding ring.
+        bounds = self.section_bounds(type_id, dims)
+        if not bounds:
             return Part.Shape()
+        r_min, r_max, z_min, z_max = bounds
+        axis = FreeCAD.Vector(0, 0, 1)
+        edges = [
+            Part.makeCircle(r, FreeCAD.Vector(0, 0, z), axis)
+            for r in (r_min, r_max)
+            for z in (z_min, z_max)
+        ]
+        return Part.Compound(edges)
 
-        r_shaft = d1 / 2.0
-        
-        # Type A Profile:
-        # The body sits on the shaft. 
-        # The back face (perpendicular to shaft) is straight.
-        # The lip extends outwards and axially.
-        
-        # Coordinates
-        # Body on shaft
-        p1 = FreeCAD.Vector(r_shaft, 0, 0) # Shaft contact start
-        p2 = FreeCAD.Vector(r_shaft, 0, A) # Shaft contact end
-        
-        # Back face (straight up)
-        # Body height is roughly half of C usually for the rigid part
-        body_h = C * 0.6
-        p3 = FreeCAD.Vector(r_shaft + body_h, 0, A) # Back top corner
-        
-        # Hinge point (thinner)
-        p4 = FreeCAD.Vector(r_shaft + body_h * 0.8, 0, A * 0.5)
-        
-        # Lip Tip
-        # Lip extends out to radius roughly r_shaft + C
-        # And axially 'forward' (negative Z relative to body, or just 0 if we orient differently)
-        # Let's orient it so the flat back is at Z=A and lip points to Z=0
-        
-        lip_r = r_shaft + C
-        lip_z = -C * 0.2 # Overhangs a bit
-        
-        p5 = FreeCAD.Vector(lip_r, 0, lip_z) # Lip tip
-        
-        # Lip inner face slope
-        p6 = FreeCAD.Vector(r_shaft + body_h * 0.5, 0, 0)
-        
-        points = [p1, p2, p3, p4, p5, p6, p1]
-
-        wire = Part.makePolygon(points)
-        face = Part.Face(wire)
-        return face.revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360)
 
-    def makeUsitRing(self, d1, d2, s, h):
-        # Generates a Usit/Bonded Seal
-        # d1 = Inner Diameter (Thread/Bolt side) - Rubber starts here
-        # d2 = Outer Diameter
-        # s = Metal Thickness
-        # h = Rubber Lip Height (total uncompressed)
-        
-        if d1 <= 0 or d2 <= 0 or s <= 0 or h < s or d2 <= d1:
-            return Part.Shape()
+_instance = None
 
-        r_in = d1 / 2.0
-        r_out = d2 / 2.0
-        
-        # Metal washer dimensions
-        # Rubber lip is usually trapezoidal on the ID
-        # Metal part starts slightly outside d1
-        
-        lip_width = 1.0 # approximate width of the rubber bead
-        if lip_width > (r_out - r_in)/2: lip_width = (r_out - r_in)/2
-        
-        r_metal_in = r_in + lip_width
-        
-        # Points
-        # Start at rubber ID, center of height (assuming symmetrical lip often, but standard usit is one-sided usually?)
-        # Standard Bonded Seal: Metal washer + rubber trapezoid on the inside.
-        # The rubber is usually thicker (h) than the metal (s).
-        # Centering the rubber on the metal thickness.
-        
-        z_metal_top = s / 2.0
-        z_metal_bot = -s / 2.0
-        z_rubber_top = h / 2.0
-        z_rubber_bot = -h / 2.0
-        
-        points = []
-        
-        # Metal Outer Face
-        points.append(FreeCAD.Vector(r_out, 0, z_metal_bot))
-        points.append(FreeCAD.Vector(r_out, 0, z_metal_top))
-        
-        # Metal Inner / Rubber Interface
-        points.append(FreeCAD.Vector(r_metal_in, 0, z_metal_top))
-        
-        # Rubber Top Slope
-        points.append(FreeCAD.Vector(r_in + 0.2, 0, z_rubber_top)) # Chamfer
-        
-        # Rubber ID
-        points.append(FreeCAD.Vector(r_in, 0, z_rubber_top * 0.5))
-        points.append(FreeCAD.Vector(r_in, 0, z_rubber_bot * 0.5))
-        
-        # Rubber Bot Slope
-        points.append(FreeCAD.Vector(r_in + 0.2, 0, z_rubber_bot))
-        
-        # Rubber/Metal Interface Bot
-        points.append(FreeCAD.Vector(r_metal_in, 0, z_metal_bot))
-        
-        # Close
-        points.append(FreeCAD.Vector(r_out, 0, z_metal_bot))
 
-        wire = Part.makePolygon(points)
-        face = Part.Face(wire)
-        return face.revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360)
+def get_instance():
+    """Return the shared SealsMakerClass, creating it on first use."""
+    global _instance
+    if _instance is None:
+        with SealsTiming.measure("maker.init"):
+            _instance = SealsMakerClass()
+    return _instance
 
 
-Instance = SealsMakerClass()
\ No newline at end of file
+def __getattr__(name):
+    # SealsMaker.Instance is resolved lazily so that importing this module
+    # does not read the seal type declarations or open the disk cache
+    if name == "Instance":
+        return get_instance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Analytic mass properties of seals.
+Every seal is a closed cross-section revolved 360 degrees around the Z axis,
+so volume and surface area follow from Pappus's centroid theorems:
+    V = 2 * pi * x_c * A     (x_c = radial centroid of the section area)
+    S = 2 * pi * sum(L_i * x_i)  (L_i, x_i = length and mid radius of each edge)
+The section quantities come from the profile kernel (SealsProfiles), so no
+B-rep is built; whole catalog tables are evaluated as NumPy arrays.
+Units: mm, mm^2, mm^3, density in kg/m^3, mass in kg.
+"""
+import numpy as np
+import SealsProfiles
+
+TWO_PI = 2.0 * np.pi
+
+
+def revolved_polygons(profiles):
+    """
+    Volume and surface area of closed (x, z) outlines revolved around Z.
+    profiles is an (N, P, 2) array whose last point repeats the first.
+    Returns (volume, area) arrays of length N.
+    """
+    return _revolved(SealsProfiles.outline_properties(profiles))
+
+
+def revolved_circles(center_radius, radius):
+    """Volume and surface area of tori (circle at center_radius revolved)."""
+    center_radius = np.asarray(center_radius, dtype=float)
+    radius = np.asarray(radius, dtype=float)
+    volume = 2.0 * np.pi ** 2 * center_radius * radius ** 2
+    area = 4.0 * np.pi ** 2 * center_radius * radius
+    return volume, area
+
+
+def _revolved(props):
+    # Pappus: section area / outline length times the path of its centroid
+    volume = TWO_PI * props["centroid_x"] * props["area"]
+    area = TWO_PI * props["perimeter_x"] * props["perimeter"]
+    return volume, area
+
+
+def compute(type_id, dims):
+    """
+    Volume (mm^3) and surface area (mm^2) for an (N, k) dims array of one seal
+    type. Rows a generator would reject yield NaN.
+    """
+    # Arcs are flattened into short segments, accurate to well below 1 %
+    return _revolved(SealsProfiles.section_properties(type_id, dims, arc_segments=32))
+
+
+def mass_properties(type_id, dims, density=None):
+    """
+    Return {"volume", "area", "mass"} for a single seal. density is in kg/m^3
+    and defaults to the seal type's nominal material density.
+    """
+    if density is None:
+        density = SealsProfiles.get_type(type_id).get("density", 1200)
+    volume, area = compute(type_id, [dims])
+    return {
+        "volume": float(volume[0]),
+        "area": float(area[0]),
+        "mass": float(volume[0] * density * 1e-9),
+    }
+
+
+def table_properties(type_id, density=None):
+    """
+    Mass properties of every row of a seal type's size table.
+    Returns (size_keys, {"volume": array, "area": array, "mass": array}).
+    """
+    import SealsMaker
+
+    definition = SealsMaker.Instance.get_definition(type_id)
+    if density is None:
+        density = definition["density"]
+    data = definition["data"]
+    count = len(definition["properties"])
+    keys = data.natural_order()
+    dims = np.array([data[k][:count] for k in keys], dtype=float).reshape(-1, count)
+    volume, area = compute(type_id, dims)
+    return keys, {"volume": volume, "area": area, "mass": volume * density * 1e-9}
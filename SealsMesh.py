@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Coin3D meshes for the seal ViewProvider.
+Seals with the same shape fingerprint reference one tessellated scene graph
+node instead of tessellating their own copy. Entries are reference counted
+per document and dropped when the last view provider releases them or its
+document is closed.
+"""
+import FreeCAD
+
+# (fingerprint, deviation) -> [faces node, edges node, {document name: reference count}]
+_entries = {}
+_observer = None
+
+
+def tessellation_tolerance(shape, deviation):
+    """Convert the ViewObject Deviation (percent) into an absolute tolerance."""
+    bb = shape.BoundBox
+    return max((bb.XLength + bb.YLength + bb.ZLength) / 300.0 * deviation, 1e-4)
+
+
+def tessellate(shape, tolerance):
+    """
+    Tessellate shape into plain data that can be passed between processes:
+    {"points": [(x, y, z), ...], "triangles": [(a, b, c), ...],
+     "edges": [[(x, y, z), ...], ...]}.
+    """
+    points = []
+    triangles = []
+    if shape.Faces:
+        vectors, triangles = shape.tessellate(tolerance)
+        points = [(p.x, p.y, p.z) for p in vectors]
+        triangles = [tuple(t) for t in triangles]
+    edges = []
+    for edge in shape.Edges:
+        discrete = edge.discretize(Deflection=tolerance)
+        if len(discrete) > 1:
+            edges.append([(p.x, p.y, p.z) for p in discrete])
+    return {"points": points, "triangles": triangles, "edges": edges}
+
+
+def nodes_from_mesh(mesh):
+    """Build (faces, edges) Coin separators from the result of tessellate()."""
+    from pivy import coin
+
+    faces = coin.SoSeparator()
+    points = mesh["points"]
+    if points:
+        hints = coin.SoShapeHints()
+        hints.vertexOrdering = coin.SoShapeHints.COUNTERCLOCKWISE
+        hints.creaseAngle = 0.5
+        coords = coin.SoCoordinate3()
+        coords.point.setValues(0, len(points), points)
+        face_set = coin.SoIndexedFaceSet()
+        indices = []
+        for a, b, c in mesh["triangles"]:
+            indices.extend((a, b, c, -1))
+        face_set.coordIndex.setValues(0, len(indices), indices)
+        faces.addChild(hints)
+        faces.addChild(coords)
+        faces.addChild(face_set)
+
+    edges = coin.SoSeparator()
+    points = [p for polyline in mesh["edges"] for p in polyline]
+    if points:
+        coords = coin.SoCoordinate3()
+        coords.point.setValues(0, len(points), points)
+        lines = coin.SoLineSet()
+        counts = [len(polyline) for polyline in mesh["edges"]]
+        lines.numVertices.setValues(0, len(counts), counts)
+        edges.addChild(coords)
+        edges.addChild(lines)
+    return faces, edges
+
+
+def build_nodes(shape, tolerance):
+    """Tessellate shape and return (faces, edges) Coin separators."""
+    return nodes_from_mesh(tessellate(shape, tolerance))
+
+
+def seal_mesh(job, deviation=0.5):
+    """
+    Generate a seal and return its tessellation, or None for invalid
+    dimensions. job is (type_id, dims). Used by worker processes of the
+    live preview.
+    """
+    import SealsMaker
+
+    type_id, dims = job
+    shape = SealsMaker.Instance.make_shape(type_id, dims)
+    if shape.isNull():
+        return None
+    return tessellate(shape, tessellation_tolerance(shape, deviation))
+
+
+class _DocumentObserver:
+    """Document observer that releases the meshes held by a closed document."""
+
+    def slotDeletedDocument(self, doc):
+        release_document(doc.Name)
+
+
+def _observe_documents():
+    global _observer
+    if _observer is None:
+        _observer = _DocumentObserver()
+        FreeCAD.addDocumentObserver(_observer)
+
+
+def acquire(fingerprint, shape, deviation, document):
+    """
+    Return (key, faces, edges) for fingerprint, tessellating shape only when
+    no other view provider holds a mesh for it. Every acquire must be paired
+    with a release(key, document); references still held when the document
+    is closed are released then.
+    """
+    _observe_documents()
+    key = (fingerprint, round(float(deviation), 4))
+    entry = _entries.get(key)
+    if entry is None:
+        # Tessellate in the object's local frame, the view provider adds the placement
+        local = shape.copy()
+        local.Placement = FreeCAD.Placement()
+        faces, edges = build_nodes(local, tessellation_tolerance(local, deviation))
+        entry = _entries[key] = [faces, edges, {}]
+    holders = entry[2]
+    holders[document] = holders.get(document, 0) + 1
+    return key, entry[0], entry[1]
+
+
+def release(key, document):
+    entry = _entries.get(key)
+    if entry is None or document not in entry[2]:
+        return
+    holders = entry[2]
+    holders[document] -= 1
+    if holders[document] <= 0:
+        del holders[document]
+    if not holders:
+        del _entries[key]
+
+
+def release_document(document):
+    """Drop all references held by the view providers of document."""
+    for key in list(_entries):
+        holders = _entries[key][2]
+        holders.pop(document, None)
+        if not holders:
+            del _entries[key]
+
+
+def clear():
+    _entries.clear()
+
+
+def stats():
+    return {
+        "meshes": len(_entries),
+        "references": sum(sum(entry[2].values()) for entry in _entries.values()),
+    }
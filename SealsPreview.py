@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Live 3D preview for the seal task panel.
+Input changes restart a short timer. When it fires, the seal is generated
+and tessellated in a background worker and shown as a temporary Coin node
+in the active 3D view; results of superseded requests are dropped. Nothing
+is added to the document, so the preview leaves no undo entries.
+Without a headless worker process only the cross-section is computed in a
+background thread; the solid is built and tessellated in the GUI thread, as
+OCC and the shape cache are not thread safe.
+"""
+from concurrent.futures.process import BrokenProcessPool
+
+import FreeCAD
+import FreeCADGui
+from PySide import QtCore
+import SealsUtils
+import SealsMesh
+import SealsProfiles
+
+DEBOUNCE_MS = 250
+PREVIEW_COLOR = (0.2, 0.55, 0.9)
+
+_executor = None
+_in_process = False
+
+
+def _thread_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    global _in_process
+    _in_process = True
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def _get_executor():
+    """
+    One background worker shared by all panels: a headless FreeCAD process,
+    so that OCC never holds the GUI thread, or a thread computing only the
+    cross-section if none is available.
+    """
+    global _executor
+    if _executor is None:
+        in_process = SealsUtils.get_params().GetBool("PreviewInProcess", False)
+        if not in_process and SealsUtils.headless_python():
+            _executor = SealsUtils.create_process_pool(1)
+        else:
+            if not in_process:
+                FreeCAD.Console.PrintMessage(
+                    "No headless FreeCAD interpreter found, building seal previews in this process\n"
+                )
+            _executor = _thread_executor()
+    return _executor
+
+
+def _fall_back_to_thread():
+    global _executor
+    FreeCAD.Console.PrintLog("Seal preview worker failed, building previews in-process\n")
+    _executor = _thread_executor()
+
+
+def _remove_node(shown):
+    """Take the preview node described by shown out of its scene graph."""
+    scene = shown.pop("scene", None)
+    node = shown.pop("node", None)
+    if scene is not None and node is not None:
+        scene.removeChild(node)
+
+
+class LivePreview(QtCore.QObject):
+    """
+    Debounced preview driven by provider(), which returns (type_id, dims,
+    placement) for the current inputs or None when there is nothing to show.
+    """
+
+    finished = QtCore.Signal(int, object)
+
+    def __init__(self, provider, parent=None):
+        super().__init__(parent)
+        self.provider = provider
+        self.enabled = SealsUtils.get_params().GetBool("LivePreview", True)
+        self.serial = 0
+        self.future = None
+        self.stopped = False
+        self.request = None
+        # {"scene": ..., "node": ...} of the shown preview; a plain dict so
+        # that the destroyed handler does not need this (deleted) object
+        self.shown = {}
+        self.destroyed.connect(lambda _obj=None, shown=self.shown: _remove_node(shown))
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_MS)
+        self.timer.timeout.connect(self.start)
+        # Emitted from the worker's thread, delivered in the GUI thread
+        self.finished.connect(self.on_finished)
+
+    def schedule(self):
+        """Restart the debounce timer after an input change."""
+        if self.enabled:
+            self.timer.start()
+
+    def start(self):
+        self.serial += 1
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+        request = self.provider()
+        if request is None:
+            self.clear()
+            return
+        type_id, dims, placement = request
+        self.request = (type_id, tuple(dims), placement)
+        self.submit()
+
+    def submit(self):
+        serial = self.serial
+        type_id, dims, _ = self.request
+        executor = _get_executor()
+        if _in_process:
+            # Compile the profile here, the thread only evaluates it
+            SealsProfiles.get_profile(type_id)
+            self.future = executor.submit(SealsProfiles.section, type_id, dims)
+        else:
+            self.future = executor.submit(SealsMesh.seal_mesh, (type_id, dims))
+        self.future.add_done_callback(lambda future: self.deliver(serial, future))
+
+    def deliver(self, serial, future):
+        """Hand a finished request to the GUI thread unless the preview was stopped."""
+        if self.stopped:
+            return
+        try:
+            self.finished.emit(serial, future)
+        except RuntimeError:
+            pass  # The panel and this object were deleted meanwhile
+
+    def on_finished(self, serial, future):
+        if serial != self.serial or future.cancelled():
+            return  # A newer input superseded this result
+        self.future = None
+        try:
+            mesh = future.result()
+        except BrokenProcessPool:
+            # The headless worker could not start or died, continue in a thread
+            _fall_back_to_thread()
+            self.submit()
+            return
+        except Exception as e:
+            FreeCAD.Console.PrintLog(f"Seal preview failed: {e}\n")
+            mesh = None
+        if isinstance(mesh, SealsProfiles.Section):
+            mesh = self.mesh_from_section(mesh)
+        if mesh is None:
+            self.clear()
+        else:
+            self.show(mesh, self.request[2])
+
+    def mesh_from_section(self, section):
+        """Build and tessellate the solid of a section in the GUI thread."""
+        import SealsMaker
+
+        try:
+            maker = SealsMaker.Instance
+            shape = SealsMaker.solid_from_section(section, maker.optimize_topology)
+            return SealsMesh.tessellate(shape, SealsMesh.tessellation_tolerance(shape, 0.5))
+        except Exception as e:
+            FreeCAD.Console.PrintLog(f"Seal preview failed: {e}\n")
+            return None
+
+    def show(self, mesh, placement):
+        from pivy import coin
+
+        gui_doc = FreeCADGui.ActiveDocument
+        view = gui_doc.ActiveView if gui_doc else None
+        if view is None or not hasattr(view, "getSceneGraph"):
+            return
+        faces, edges = SealsMesh.nodes_from_mesh(mesh)
+        root = coin.SoSeparator()
+        transform = coin.SoTransform()
+        base = placement.Base
+        transform.translation.setValue(base.x, base.y, base.z)
+        transform.rotation.setValue(tuple(placement.Rotation.Q))
+        root.addChild(transform)
+        face_material = coin.SoMaterial()
+        face_material.diffuseColor.setValue(PREVIEW_COLOR)
+        face_material.transparency.setValue(0.4)
+        root.addChild(face_material)
+        root.addChild(faces)
+        line_material = coin.SoMaterial()
+        line_material.diffuseColor.setValue(PREVIEW_COLOR)
+        root.addChild(line_material)
+        root.addChild(edges)
+
+        self.clear()
+        scene = view.getSceneGraph()
+        scene.addChild(root)
+        self.shown.update(scene=scene, node=root)
+
+    def clear(self):
+        """Remove the preview node from the 3D view."""
+        _remove_node(self.shown)
+
+    def stop(self):
+        """Cancel pending work and remove the preview, e.g. when the panel closes."""
+        self.stopped = True
+        self.timer.stop()
+        self.serial += 1
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+        self.clear()
@@ -0,0 +1,543 @@
+# -*- coding: utf-8 -*-
+"""
+Declarative seal profile registry.
+
+Seal types are declared as data in JSON files (SealsData/seal_types.json plus
+any *.json file in additional type directories). Each type names its size
+table, UI metadata and a cross-section profile. Profiles describe the closed
+outline of the seal section in the XZ plane (x = radius, z = axial) as
+expressions over the type's parameters, e.g. "d1 / 2 + C".
+
+Profiles are read and compiled into a vectorized evaluator only when a type
+is used for the first time. The evaluator maps any number of parameter rows
+onto outlines in one NumPy pass. section() and section_properties() answer
+questions about a seal's cross-section (extents, area, centroid) without
+building a solid.
+
+This module does not depend on FreeCAD.
+"""
+import os
+import ast
+import keyword
+import json
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+_dir = os.path.dirname(__file__)
+TYPES_FILE = os.path.join(_dir, "SealsData", "seal_types.json")
+FORMAT_VERSION = 1
+
+# Names usable in profile expressions besides parameters and derived values
+EXPRESSION_NAMESPACE = {
+    "min": np.minimum,
+    "max": np.maximum,
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "pi": np.pi,
+}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name,
+    ast.Load, ast.Constant, ast.operator, ast.unaryop, ast.cmpop,
+)
+
+# Names a parameter or derived value may not take
+_RESERVED_NAMES = set(EXPRESSION_NAMESPACE) | {"u", "v"}
+
+_types = None  # OrderedDict type_id -> metadata, filled by load_types()
+_search_dirs = []
+_compiled = {}  # type_id -> CompiledProfile
+
+
+class ProfileError(ValueError):
+    """Raised for malformed type or profile declarations."""
+
+
+# --- Type declarations ----------------------------------------------------------
+def set_search_dirs(dirs):
+    """Set extra directories scanned for *.json type declarations."""
+    global _types
+    _search_dirs[:] = [d for d in dirs if d]
+    _types = None
+    _compiled.clear()
+
+
+def _read_types_file(path, types):
+    with open(path, "r", encoding="utf-8") as f:
+        content = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for entry in content.get("types", []):
+        type_id = entry.get("id")
+        if not type_id or "profile" not in entry:
+            raise ProfileError(f"{path}: seal types need an 'id' and a 'profile'")
+        entry = dict(entry)
+        entry["base_dir"] = base_dir
+        types[type_id] = entry
+
+
+def load_types():
+    """
+    Return the OrderedDict of declared seal types (metadata only, profiles are
+    not read). Later directories override types of the same id.
+    """
+    global _types
+    if _types is None:
+        types = OrderedDict()
+        _read_types_file(TYPES_FILE, types)
+        for directory in _search_dirs:
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(".json"):
+                    _read_types_file(os.path.join(directory, name), types)
+        _types = types
+    return _types
+
+
+def type_ids():
+    return list(load_types().keys())
+
+
+def get_type(type_id):
+    return load_types().get(type_id)
+
+
+# --- Profiles -------------------------------------------------------------------
+def get_profile(type_id):
+    """Return the CompiledProfile of type_id, loading it on first use."""
+    profile = _compiled.get(type_id)
+    if profile is None:
+        entry = get_type(type_id)
+        if entry is None:
+            raise KeyError(f"Unknown seal type: {type_id}")
+        declaration = entry["profile"]
+        if isinstance(declaration, str):
+            path = os.path.join(entry["base_dir"], declaration)
+            with open(path, "r", encoding="utf-8") as f:
+                declaration = json.load(f)
+        profile = _compiled[type_id] = CompiledProfile(type_id, declaration)
+    return profile
+
+
+def _check_name(name, names, where):
+    """Validate a parameter or derived name; names are those already bound."""
+    if (
+        not isinstance(name, str)
+        or not name.isidentifier()
+        or keyword.iskeyword(name)
+        or name in _RESERVED_NAMES
+    ):
+        raise ProfileError(f"{where}: invalid name {name!r}")
+    if name in names:
+        raise ProfileError(f"{where}: duplicate name {name!r}")
+    return name
+
+
+def _check_expression(expr, names, where):
+    """Parse and validate one expression, returning its AST node."""
+    if isinstance(expr, bool) or not isinstance(expr, (str, int, float)):
+        raise ProfileError(f"{where}: invalid expression {expr!r}")
+    try:
+        tree = ast.parse(str(expr), mode="eval")
+    except SyntaxError as e:
+        raise ProfileError(f"{where}: invalid expression {expr!r}: {e}")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ProfileError(f"{where}: unsupported syntax in {expr!r}")
+        if isinstance(node, ast.Name) and node.id not in names:
+            raise ProfileError(f"{where}: unknown name {node.id!r} in {expr!r}")
+        if isinstance(node, ast.Call) and not isinstance(node.func, ast.Name):
+            raise ProfileError(f"{where}: unsupported call in {expr!r}")
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float))
+        ):
+            raise ProfileError(f"{where}: only numbers are allowed as constants in {expr!r}")
+    return tree.body
+
+
+def _function(name, args, assignments, result):
+    """FunctionDef node: def name(*args): <assignments>; return result"""
+    body = [
+        ast.Assign(targets=[ast.Name(id=target, ctx=ast.Store())], value=value)
+        for target, value in assignments
+    ]
+    body.append(ast.Return(value=result))
+    arguments = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=arg) for arg in args],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+    fields = {}
+    if "type_params" in ast.FunctionDef._fields:
+        fields["type_params"] = []  # Python 3.12+
+    return ast.FunctionDef(
+        name=name, args=arguments, body=body, decorator_list=[], returns=None, **fields
+    )
+
+
+def _tuple(items):
+    return ast.Tuple(elts=list(items), ctx=ast.Load())
+
+
+class CompiledProfile:
+    """
+    Evaluator for one profile declaration.
+
+    kind "polygon": evaluate() returns an (N, P, 2) array of closed outlines.
+        Points listed in arc_mids are midpoints of three-point arcs running
+        from the previous to the next point.
+    kind "circle": evaluate() returns an (N, 3) array of (x_center, z_center,
+        radius) rows.
+    """
+
+    def __init__(self, type_id, declaration):
+        self.type_id = type_id
+        self.declaration = declaration
+        if declaration.get("format", FORMAT_VERSION) != FORMAT_VERSION:
+            raise ProfileError(f"{type_id}: unsupported profile format")
+        self.parameters = list(declaration["parameters"])
+        self.signature = hashlib.sha1(
+            json.dumps(declaration, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        outline = declaration["outline"]
+        self.kind = outline.get("kind", "polygon")
+        self.arc_mids = ()
+        self._points = None
+        self._evaluate, self._valid = self._compile(declaration, outline)
+
+    # --- compilation ---
+    def _compile(self, declaration, outline):
+        # The evaluators are assembled from validated AST nodes, never from
+        # declaration text, so a declaration can only describe arithmetic.
+        where = f"{self.type_id} profile"
+        names = set(EXPRESSION_NAMESPACE)
+        for name in self.parameters:
+            names.add(_check_name(name, names, where))
+        assignments = []
+        for name, expr in declaration.get("derived", {}).items():
+            value = _check_expression(expr, names, where)
+            assignments.append((_check_name(name, names, where), value))
+            names.add(name)
+
+        args = list(self.parameters)
+        if self.kind == "circle":
+            center = [_check_expression(e, names, where) for e in outline["center"]]
+            radius = _check_expression(outline["radius"], names, where)
+            result = _tuple([center[0], center[1], radius])
+        elif self.kind == "polygon" and "points" in outline:
+            # Fixed point list mapped through one x and one z expression;
+            # u and v are the point columns.
+            self._points = np.asarray(outline["points"], dtype=float)
+            names |= {"u", "v"}
+            args += ["u", "v"]
+            x = _check_expression(outline["x"], names, where)
+            z = _check_expression(outline["z"], names, where)
+            result = _tuple([x, z])
+        elif self.kind == "polygon":
+            items = []
+            mids = []
+            for i, vertex in enumerate(outline["vertices"]):
+                if isinstance(vertex, dict):
+                    vertex = vertex["arc_through"]
+                    mids.append(i)
+                x, z = (_check_expression(e, names, where) for e in vertex)
+                items.append(_tuple([x, z]))
+            self.arc_mids = tuple(mids)
+            result = _tuple(items)
+        else:
+            raise ProfileError(f"{where}: unknown outline kind {self.kind!r}")
+
+        conditions = [_check_expression(e, names, where) for e in declaration.get("valid", [])]
+        validity = conditions[0] if conditions else ast.Constant(value=True)
+        for condition in conditions[1:]:
+            validity = ast.BinOp(left=validity, op=ast.BitAnd(), right=condition)
+
+        module = ast.Module(
+            body=[
+                _function("_evaluate", args, assignments, result),
+                _function("_valid", self.parameters, assignments, validity),
+            ],
+            type_ignores=[],
+        )
+        ast.fix_missing_locations(module)
+        namespace = dict(EXPRESSION_NAMESPACE)
+        namespace["__builtins__"] = {}
+        exec(compile(module, f"<{where}>", "exec"), namespace)
+        return namespace["_evaluate"], namespace["_valid"]
+
+    # --- evaluation ---
+    def _columns(self, dims):
+        dims = np.asarray(dims, dtype=float).reshape(-1, len(self.parameters))
+        return dims, [dims[:, i] for i in range(dims.shape[1])]
+
+    def evaluate(self, dims):
+        """Evaluate the profile for one parameter row or an (N, k) array."""
+        dims, columns = self._columns(dims)
+        count = dims.shape[0]
+        if self.kind == "circle":
+            values = self._evaluate(*columns)
+            return np.stack([np.broadcast_to(v, (count,)) for v in values], axis=-1)
+        if self._points is not None:
+            columns = [c[:, None] for c in columns]
+            x, z = self._evaluate(*columns, self._points[:, 0], self._points[:, 1])
+            shape = (count, len(self._points))
+            return np.stack((np.broadcast_to(x, shape), np.broadcast_to(z, shape)), axis=-1)
+        vertices = self._evaluate(*columns)
+        x = np.stack([np.broadcast_to(v[0], (count,)) for v in vertices], axis=-1)
+        z = np.stack([np.broadcast_to(v[1], (count,)) for v in vertices], axis=-1)
+        return np.stack((x, z), axis=-1)
+
+    def valid(self, dims):
+        """Boolean mask of the rows that describe a buildable seal."""
+        dims, columns = self._columns(dims)
+        return np.broadcast_to(self._valid(*columns), (dims.shape[0],)).copy()
+
+    def polyline(self, dims, arc_segments=8):
+        """
+        Polygon outlines with arcs replaced by arc_segments straight segments.
+        Only meaningful for polygon profiles.
+        """
+        points = self.evaluate(dims)
+        if not self.arc_mids:
+            return points
+        parts = []
+        start = 0
+        for mid in self.arc_mids:
+            parts.append(points[:, start:mid])
+            parts.append(_arc_points(points[:, mid - 1], points[:, mid], points[:, mid + 1], arc_segments))
+            start = mid + 1
+        parts.append(points[:, start:])
+        return np.concatenate(parts, axis=1)
+
+    def bounds(self, dims):
+        """(N, 4) array of (r_min, r_max, z_min, z_max) of the section."""
+        if self.kind == "circle":
+            c = self.evaluate(dims)
+            return np.stack(
+                (c[:, 0] - c[:, 2], c[:, 0] + c[:, 2], c[:, 1] - c[:, 2], c[:, 1] + c[:, 2]), axis=-1
+            )
+        points = self.polyline(dims)
+        return np.stack(
+            (
+                points[:, :, 0].min(axis=1),
+                points[:, :, 0].max(axis=1),
+                points[:, :, 1].min(axis=1),
+                points[:, :, 1].max(axis=1),
+            ),
+            axis=-1,
+        )
+
+
+# --- Section queries ----------------------------------------------------------
+class Section:
+    """
+    Cross-section of one seal in the XZ plane (x = radius, z = axial).
+
+    Polygon sections hold the closed outline in points (last point repeats
+    the first) and the indices of arc midpoints in arc_mids; circle sections
+    hold center (x, z) and radius. Turning a section into a solid is left to
+    a geometry backend, see SealsMaker.solid_from_section.
+    """
+
+    def __init__(self, type_id, dims, kind, points=None, arc_mids=(), center=None, radius=None):
+        self.type_id = type_id
+        self.dims = tuple(float(d) for d in dims)
+        self.kind = kind
+        self.points = points
+        self.arc_mids = tuple(arc_mids)
+        self.center = center
+        self.radius = radius
+
+    def __repr__(self):
+        return f"Section({self.type_id!r}, {self.dims})"
+
+    def polyline(self, arc_segments=32):
+        """(M, 2) closed outline with arcs (or the circle) as straight segments."""
+        if self.kind == "circle":
+            angles = np.linspace(0.0, 2.0 * np.pi, 4 * arc_segments + 1)
+            return np.stack(
+                (self.center[0] + self.radius * np.cos(angles), self.center[1] + self.radius * np.sin(angles)),
+                axis=-1,
+            )
+        return get_profile(self.type_id).polyline(self.dims, arc_segments)[0]
+
+    @property
+    def bounds(self):
+        """(r_min, r_max, z_min, z_max)"""
+        return tuple(get_profile(self.type_id).bounds(self.dims)[0].tolist())
+
+    @property
+    def inner_radius(self):
+        return self.bounds[0]
+
+    @property
+    def outer_radius(self):
+        return self.bounds[1]
+
+    @property
+    def width(self):
+        """Radial extent."""
+        r_min, r_max, _, _ = self.bounds
+        return r_max - r_min
+
+    @property
+    def height(self):
+        """Axial extent."""
+        _, _, z_min, z_max = self.bounds
+        return z_max - z_min
+
+    def properties(self, arc_segments=32):
+        """Area, centroid and perimeter, see section_properties()."""
+        props = section_properties(self.type_id, self.dims, arc_segments)
+        return {key: float(value[0]) for key, value in props.items()}
+
+    def to_dict(self):
+        """Plain data form, e.g. for JSON export."""
+        data = {"type": self.type_id, "dims": list(self.dims), "kind": self.kind}
+        if self.kind == "circle":
+            data["center"] = [float(v) for v in self.center]
+            data["radius"] = float(self.radius)
+        else:
+            data["points"] = self.points.tolist()
+            data["arc_mids"] = list(self.arc_mids)
+        return data
+
+
+def section(type_id, dims):
+    """Return the Section of a seal, or None if dims do not describe a valid one."""
+    profile = get_profile(type_id)
+    if len(dims) != len(profile.parameters) or not profile.valid(dims)[0]:
+        return None
+    values = profile.evaluate(dims)[0]
+    if profile.kind == "circle":
+        x, z, radius = values.tolist()
+        return Section(type_id, dims, "circle", center=(x, z), radius=radius)
+    return Section(type_id, dims, "polygon", points=values, arc_mids=profile.arc_mids)
+
+
+def outline_properties(outlines):
+    """
+    Area, centroid and perimeter of closed (N, P, 2) outlines whose last
+    point repeats the first. Returns a dict of length N arrays:
+        area, centroid_x, centroid_z - enclosed area and its centroid
+        perimeter, perimeter_x       - outline length and the mean radius
+                                       (x) along the outline
+    """
+    outlines = np.asarray(outlines, dtype=float)
+    x0, z0 = outlines[:, :-1, 0], outlines[:, :-1, 1]
+    x1, z1 = outlines[:, 1:, 0], outlines[:, 1:, 1]
+    cross = x0 * z1 - x1 * z0
+    signed_area = cross.sum(axis=1) / 2.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centroid_x = ((x0 + x1) * cross).sum(axis=1) / 6.0 / signed_area
+        centroid_z = ((z0 + z1) * cross).sum(axis=1) / 6.0 / signed_area
+        lengths = np.hypot(x1 - x0, z1 - z0)
+        perimeter = lengths.sum(axis=1)
+        perimeter_x = (lengths * (x0 + x1) / 2.0).sum(axis=1) / perimeter
+    return {
+        "area": np.abs(signed_area),
+        "centroid_x": centroid_x,
+        "centroid_z": centroid_z,
+        "perimeter": perimeter,
+        "perimeter_x": perimeter_x,
+    }
+
+
+def section_properties(type_id, dims, arc_segments=32):
+    """
+    Section properties for one parameter row or an (N, k) array of rows:
+    the outline_properties() plus r_min, r_max, z_min, z_max. Arcs are
+    flattened into arc_segments segments; circles are exact. Rows a
+    generator would reject yield NaN.
+    """
+    profile = get_profile(type_id)
+    dims = np.asarray(dims, dtype=float).reshape(-1, len(profile.parameters))
+    if profile.kind == "circle":
+        circles = profile.evaluate(dims)
+        x, z, radius = circles[:, 0], circles[:, 1], circles[:, 2]
+        props = {
+            "area": np.pi * radius ** 2,
+            "centroid_x": x.copy(),
+            "centroid_z": z.copy(),
+            "perimeter": 2.0 * np.pi * radius,
+            "perimeter_x": x.copy(),
+        }
+    else:
+        props = outline_properties(profile.polyline(dims, arc_segments))
+    bounds = profile.bounds(dims)
+    for i, key in enumerate(("r_min", "r_max", "z_min", "z_max")):
+        props[key] = bounds[:, i].copy()
+    invalid = ~profile.valid(dims)
+    for values in props.values():
+        values[invalid] = np.nan
+    return props
+
+
+def merge_collinear(points, arc_mids=(), tolerance=1e-9):
+    """
+    Remove repeated vertices and vertices lying on the straight line through
+    their neighbours from one closed (P, 2) outline whose last point repeats
+    the first. Arc points and their end points are kept. tolerance is
+    relative to the outline size. Returns (points, arc_mids) with arc_mids
+    renumbered for the reduced outline.
+    """
+    points = np.asarray(points, dtype=float)
+    ring = points[:-1]
+    count = len(ring)
+    protected = np.zeros(count, dtype=bool)
+    for mid in arc_mids:
+        protected[[(mid - 1) % count, mid, (mid + 1) % count]] = True
+    keep = np.arange(count)
+    eps = tolerance * max(float(np.ptp(ring, axis=0).max()), 1.0)
+
+    # Repeated vertices first, so that every remaining segment has a direction
+    step = ring - np.roll(ring, 1, axis=0)
+    repeated = (np.hypot(step[:, 0], step[:, 1]) <= eps) & ~protected
+    keep = keep[~repeated]
+
+    kept = ring[keep]
+    a = kept - np.roll(kept, 1, axis=0)
+    b = np.roll(kept, -1, axis=0) - kept
+    cross = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    dot = (a * b).sum(axis=1)
+    length = np.hypot(a[:, 0], a[:, 1]) * np.hypot(b[:, 0], b[:, 1])
+    straight = (np.abs(cross) <= tolerance * length) & (dot > 0) & ~protected[keep]
+    keep = keep[~straight]
+    if len(keep) < 3:
+        return points, tuple(arc_mids)
+
+    remap = {int(old): new for new, old in enumerate(keep)}
+    reduced = np.concatenate((ring[keep], ring[keep[:1]]))
+    return reduced, tuple(remap[mid] for mid in arc_mids)
+
+
+def _arc_points(p0, p1, p2, segments):
+    """
+    Interior points of the arcs through p0, p1, p2 (each (N, 2)), returned as
+    an (N, segments - 1, 2) array. Degenerate (collinear) arcs become lines.
+    """
+    t = np.linspace(0.0, 1.0, segments + 1)[1:-1]
+    ax, ay = p0[:, 0], p0[:, 1]
+    bx, by = p1[:, 0], p1[:, 1]
+    cx, cy = p2[:, 0], p2[:, 1]
+    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    straight = np.abs(d) < 1e-12
+    d = np.where(straight, 1.0, d)
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+    radius = np.hypot(ax - ux, ay - uy)
+    start = np.arctan2(ay - uy, ax - ux)
+    end = np.arctan2(cy - uy, cx - ux)
+    # Positive d: counter-clockwise from p0 through p1 to p2
+    ccw = d > 0
+    sweep = np.where(ccw, np.mod(end - start, 2 * np.pi), -np.mod(start - end, 2 * np.pi))
+    angles = start[:, None] + sweep[:, None] * t
+    arc = np.stack((ux[:, None] + radius[:, None] * np.cos(angles),
+                    uy[:, None] + radius[:, None] * np.sin(angles)), axis=-1)
+    line = p0[:, None, :] + (p2 - p0)[:, None, :] * t[None, :, None]
+    return np.where(straight[:, None, None], line, arc)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Startup timing of SealsWorkbench.
+The first run of each startup step (workbench activation, first command,
+first seal, loading of the seal types and size tables) is timed and kept for
+the session; later runs are not measured. Steps started inside another step
+are shown indented in the report.
+Use the "Startup Timing" menu command or print(SealsTiming.report()).
+"""
+import time
+from contextlib import contextmanager
+
+import FreeCAD
+
+# name -> (start in seconds since session_start, duration in seconds, depth)
+_steps = {}
+_depth = 0
+session_start = time.perf_counter()
+
+
+def record(name, start, duration, depth=0):
+    """Store a step unless it was recorded before."""
+    if name in _steps:
+        return
+    _steps[name] = (start - session_start, duration, depth)
+    FreeCAD.Console.PrintLog(f"SealsWorkbench: {name} took {duration * 1000.0:.1f} ms\n")
+
+
+@contextmanager
+def measure(name):
+    """
+    Time the first run of the startup step called name. Keep it out of hot
+    paths: callers that run often check their own flag before entering.
+    """
+    global _depth
+    if name in _steps:
+        yield
+        return
+    depth = _depth
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _depth = depth
+        record(name, start, time.perf_counter() - start, depth)
+
+
+def steps():
+    """Return [(name, duration in seconds), ...] in the order the steps started."""
+    ordered = sorted(_steps.items(), key=lambda item: item[1][0])
+    return [(name, duration) for name, (_, duration, _) in ordered]
+
+
+def report():
+    """Human readable table of the recorded steps in milliseconds."""
+    if not _steps:
+        return "SealsWorkbench startup timing: nothing recorded yet\n"
+    lines = ["SealsWorkbench startup timing (first run, ms):"]
+    for name, (start, duration, depth) in sorted(_steps.items(), key=lambda item: item[1][0]):
+        label = "  " * (depth + 1) + name
+        lines.append(f"{label:<36}{duration * 1000.0:>10.1f}")
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Forget all recorded steps, e.g. before measuring again in a test run."""
+    global _depth
+    _steps.clear()
+    _depth = 0
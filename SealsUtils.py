@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 import os
+import sys
 import csv
-import re
+import json
 import FreeCAD
 
 # --- Path Handling ---
@@ -9,50 +10,217 @@ _dir = os.path.dirname(__file__)
 iconPath = os.path.join(_dir, "Icons")
 dataPath = os.path.join(_dir, "SealsData")
 
+# --- Preferences ---
+PARAM_PATH = "User parameter:BaseApp/Preferences/Mod/SealsWorkbench"
+
+
+def get_params():
+    """Returns the FreeCAD parameter group holding the workbench preferences."""
+    return FreeCAD.ParamGet(PARAM_PATH)
+
 
 def get_icon(name):
     """Returns the full path to an icon file."""
     return os.path.join(iconPath, name)
 
 
+def user_cache_dir(*parts):
+    """Return the workbench directory inside FreeCAD's user cache location."""
+    try:
+        base = FreeCAD.getUserCachePath()
+    except AttributeError:
+        # FreeCAD < 0.20 has no dedicated cache directory
+        base = FreeCAD.getUserAppDataDir()
+    return os.path.join(base, "SealsWorkbench", *parts)
+
+
 def load_csv_data(filename):
     """
     Loads a CSV file from the SealsData directory.
-    Returns a dictionary where key is the name, and value is a tuple of floats.
+    Returns a SealsCatalog.SizeTable mapping the name to a tuple of floats,
+    indexed for nearest size and range queries on the value columns.
+    Parsed files are compiled into the user cache directory, so later
+    sessions memory-map them instead (CatalogCacheEnabled preference).
     """
+    # NumPy is only needed once a table is read
+    import SealsCatalog
+
     file_path = os.path.join(dataPath, filename)
+    if not os.path.exists(file_path):
+        FreeCAD.Console.PrintError(f"Data file not found: {file_path}\n")
+        return SealsCatalog.SizeTable({})
+    if get_params().GetBool("CatalogCacheEnabled", True):
+        return SealsCatalog.cached_table(file_path, user_cache_dir("catalogs"), parse_csv_data)
+    return parse_csv_data(file_path)
+
+
+def parse_csv_data(file_path):
+    """Read a size table CSV (a "name" column plus value columns) into a SizeTable."""
+    import SealsCatalog
+
     data = {}
-    if os.path.exists(file_path):
-        with open(file_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    key = row.get("name")
-                    if not key:
+    columns = []
+    filename = os.path.basename(file_path)
+    with open(file_path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        columns = [c for c in (reader.fieldnames or []) if c != "name"]
+        for row in reader:
+            try:
+                key = row.get("name")
+                if not key:
+                    continue
+                values = []
+                for k, v in row.items():
+                    if k == "name":
                         continue
-                    values = []
-                    for k, v in row.items():
-                        if k == "name":
-                            continue
-                        try:
-                            values.append(float(v))
-                        except (TypeError, ValueError):
-                            values.append(v)
-                    data[key] = tuple(values)
-                except Exception as e:
-                    FreeCAD.Console.PrintMessage(f"Error reading row in {filename}: {e}\n")
-    else:
-        FreeCAD.Console.PrintError(f"Data file not found: {file_path}\n")
-    return data
+                    try:
+                        values.append(float(v))
+                    except (TypeError, ValueError):
+                        values.append(v)
+                data[key] = tuple(values)
+            except Exception as e:
+                FreeCAD.Console.PrintMessage(f"Error reading row in {filename}: {e}\n")
+    return SealsCatalog.SizeTable(data, columns)
+
+
+# --- Catalog overlays ---
+# User and vendor size tables are merged over the built-in tables. A catalog
+# directory holds <type_id>.csv files, or a catalog.json naming its tables:
+#     {"source": "Acme", "priority": 60, "tables": {"oring": "acme_orings.csv"}}
+# Sizes of a higher priority catalog replace built-in or lower priority sizes
+# with the same name; on equal priority the earlier directory wins.
+BUILTIN_PRIORITY = 0
+USER_CATALOG_PRIORITY = 100
+VENDOR_CATALOG_PRIORITY = 50
+
+
+def catalog_dirs():
+    """
+    Return [(directory, default tag, default priority)]: the user's own
+    catalogs in <UserAppData>/SealsWorkbench/catalogs, then the directories
+    listed in the CatalogPaths preference (separated by ';').
+    """
+    user_dir = os.path.join(FreeCAD.getUserAppDataDir(), "SealsWorkbench", "catalogs")
+    dirs = [(user_dir, "user", USER_CATALOG_PRIORITY)]
+    for path in get_params().GetString("CatalogPaths", "").split(";"):
+        path = os.path.expanduser(path.strip())
+        if path:
+            dirs.append((path, os.path.basename(os.path.normpath(path)), VENDOR_CATALOG_PRIORITY))
+    return dirs
+
+
+def catalog_sources(type_id):
+    """Return [(tag, priority, csv path)] of the overlay tables for type_id."""
+    sources = []
+    for directory, tag, priority in catalog_dirs():
+        if not os.path.isdir(directory):
+            continue
+        files = [f"{type_id}.csv"]
+        manifest = os.path.join(directory, "catalog.json")
+        if os.path.isfile(manifest):
+            try:
+                with open(manifest, "r", encoding="utf-8") as f:
+                    content = json.load(f)
+                tag = str(content.get("source", tag))
+                priority = float(content.get("priority", priority))
+                tables = content.get("tables", {}).get(type_id, [])
+                files = [tables] if isinstance(tables, str) else list(tables)
+            except (OSError, ValueError, AttributeError, TypeError) as e:
+                FreeCAD.Console.PrintWarning(f"Invalid catalog manifest {manifest}: {e}\n")
+                continue
+        for name in files:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                sources.append((tag, priority, path))
+    return sources
+
+
+def load_catalog(type_id, data_file=""):
+    """
+    Return the size table of type_id: the built-in data_file merged with the
+    overlay catalogs (see catalog_sources), each row tagged with its source.
+    """
+    import SealsCatalog
+
+    tables = []
+    if data_file:
+        tag = os.path.splitext(os.path.basename(data_file))[0]
+        tables.append((BUILTIN_PRIORITY, 0, tag, load_csv_data(data_file)))
+    for position, (tag, priority, path) in enumerate(catalog_sources(type_id)):
+        table = load_csv_data(path)
+        if tables and not set(tables[0][3].columns) <= set(table.columns):
+            FreeCAD.Console.PrintWarning(
+                f"Catalog {path} skipped: columns {tables[0][3].columns} are required\n"
+            )
+            continue
+        tables.append((priority, -position - 1, tag, table))
+    if not tables:
+        return SealsCatalog.SizeTable({})
+    # The built-in table defines the columns, so it stays first
+    tables[1:] = sorted(tables[1:], key=lambda entry: entry[:2])
+    return SealsCatalog.merge_tables([(tag, table) for _, _, tag, table in tables])
 
 
 def natural_sort_key(value):
-    """Return a key suitable for natural sorting of strings like '10x2'."""
-    parts = re.split(r"(\d+)", str(value))
-    processed = []
-    for p in parts:
-        if p.isdigit():
-            processed.append(int(p))
-        else:
-            processed.append(p.lower())
-    return processed
+    """Natural sort key for strings like '10x2', see SealsCatalog."""
+    import SealsCatalog
+
+    return SealsCatalog.natural_sort_key(value)
+
+
+# --- Worker processes ---
+def headless_python():
+    """
+    Return the path of a Python interpreter that can import FreeCAD without
+    starting the GUI, or None when no such interpreter is found.
+    Inside the FreeCAD GUI sys.executable is the FreeCAD binary itself, so
+    only the interpreter shipped in FreeCAD's bin directory qualifies; a
+    python from PATH may not match FreeCAD's Python version.
+    """
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    try:
+        bin_dir = os.path.join(FreeCAD.getHomePath(), "bin")
+    except Exception:
+        bin_dir = ""
+    for name in ("python.exe", "python3", "python"):
+        candidate = os.path.join(bin_dir, name)
+        if bin_dir and os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _init_worker(home_path):
+    """Make FreeCAD importable in a freshly spawned worker process."""
+    bin_dir = os.path.join(home_path, "bin")
+    if hasattr(os, "add_dll_directory") and os.path.isdir(bin_dir):
+        os.add_dll_directory(bin_dir)
+    import FreeCAD  # noqa: F401
+
+
+def create_process_pool(workers):
+    """
+    Create a process pool of headless FreeCAD interpreters.
+    Workers inherit sys.path from this process, so the workbench modules and
+    FreeCAD's lib directory are importable there. Raises RuntimeError when
+    headless_python() finds no interpreter; check it first to fall back to
+    in-process generation.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    python = headless_python()
+    if not python:
+        raise RuntimeError("No headless FreeCAD interpreter found")
+    ctx = multiprocessing.get_context("spawn")
+    ctx.set_executable(python)
+    try:
+        home_path = FreeCAD.getHomePath()
+    except Exception:
+        home_path = ""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(home_path,),
+    )